@@ -12,21 +12,127 @@ A comprehensive Python client for the Substack API with:
 Author: Built by exploring the Substack API
 """
 
+import atexit
+import base64
+import functools
+import mimetypes
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import math
 import re
+import threading
 import time
+import urllib.parse
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any, Union
 from dataclasses import dataclass, field
 from datetime import datetime
-from urllib.parse import urlparse
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
+
+# =============================================================================
+# JSON SERIALIZATION
+# =============================================================================
+
+def _dumps(obj: Any) -> str:
+    """Serialize to a compact JSON string, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _dumpb(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, ready to send as a request body"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text or bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# =============================================================================
+# HTTP TRANSPORT
+# =============================================================================
+
+def _build_session() -> requests.Session:
+    """Create a pooled keep-alive session with retries on transient gateway errors"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket on the monotonic clock.
+
+    Allows bursts of up to `capacity` requests and refills at `rate` tokens per
+    second. Callers that find the bucket empty reserve a future token and sleep
+    until it is due, so concurrent threads queue up rather than stampede. The
+    rate is halved on throttling (slow_down) and restored additively on success
+    (speed_up), never exceeding the configured rate.
+    """
+
+    __slots__ = ("max_rate", "rate", "capacity", "tokens", "last", "_lock")
+
+    def __init__(self, rate: float, capacity: float):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self):
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+    def slow_down(self):
+        with self._lock:
+            self.rate = max(self.rate / 2, self.max_rate / 16)
+
+    def speed_up(self):
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+# Retries on 429 Too Many Requests before the error is surfaced
+_MAX_THROTTLE_RETRIES = 3
+
+# URLs remembered for conditional GETs (least recently used are evicted)
+_ETAG_CACHE_SIZE = 128
 
 
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SubstackProfile:
     """User profile"""
     id: int
@@ -40,7 +146,7 @@ class SubstackProfile:
         return f"https://substack.com/@{self.handle}"
 
 
-@dataclass
+@dataclass(slots=True)
 class SubstackPost:
     """Published post"""
     id: int
@@ -58,8 +164,28 @@ class SubstackPost:
     cover_image: str = ""
     type: str = "newsletter"
 
+    # API keys (same as field names) and defaults for the immutable fields;
+    # the dict fields get a fresh {} per post in from_api
+    _API_DEFAULTS = (
+        ("title", ""), ("slug", ""), ("subtitle", ""), ("body_html", ""),
+        ("canonical_url", ""), ("post_date", ""), ("audience", "everyone"),
+        ("comment_count", 0), ("wordcount", 0), ("cover_image", ""),
+        ("type", "newsletter"),
+    )
+
+    @classmethod
+    def from_api(cls, p: Dict) -> 'SubstackPost':
+        """Build from a post dict as returned by the archive and post endpoints"""
+        get = p.get
+        return cls(
+            id=p["id"],
+            body_json=get("body_json", {}),
+            reactions=get("reactions", {}),
+            **{name: get(name, default) for name, default in cls._API_DEFAULTS}
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class SubstackDraft:
     """Draft post"""
     id: int
@@ -70,7 +196,7 @@ class SubstackDraft:
     cover_image: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SubstackNote:
     """Short-form note"""
     id: str
@@ -85,6 +211,13 @@ class SubstackNote:
 # DOCUMENT BUILDER - ProseMirror Format
 # =============================================================================
 
+# Shared mark dicts; each node gets its own marks list but the marks themselves
+# are never mutated, so they are not rebuilt per span.
+_STRONG_MARK = {"type": "strong"}
+_EM_MARK = {"type": "em"}
+_CODE_MARK = {"type": "code"}
+
+
 class SubstackDocument:
     """
     Build Substack-compatible documents using ProseMirror format.
@@ -97,8 +230,37 @@ class SubstackDocument:
         doc.bullet_list(["Item 1", "Item 2"])
 
         body_json = doc.build()
+
+    `content` holds the finished ProseMirror nodes. build() wraps that list
+    without copying it, so the converter (and callers) can append prebuilt
+    nodes directly and no second tree is created before serialization.
     """
 
+    __slots__ = ("content",)
+
+    # Full image2 attribute set in the order Substack's editor emits it;
+    # image() overrides the per-image values.
+    _IMG_ATTR_TEMPLATE = {
+        "src": None,
+        "srcNoWatermark": None,
+        "fullscreen": None,
+        "imageSize": None,
+        "height": None,
+        "width": None,
+        "resizeWidth": None,
+        "bytes": None,
+        "alt": None,
+        "title": None,
+        "type": None,
+        "href": None,
+        "belowTheFold": False,
+        "topImage": False,
+        "internalRedirect": None,  # Set by create_draft after we have draft_id
+        "isProcessing": False,
+        "align": None,
+        "offset": False
+    }
+
     def __init__(self):
         self.content: List[Dict] = []
 
@@ -115,17 +277,17 @@ class SubstackDocument:
     @staticmethod
     def bold(content: str) -> Dict:
         """Bold text"""
-        return {"type": "text", "text": content, "marks": [{"type": "strong"}]}
+        return {"type": "text", "text": content, "marks": [_STRONG_MARK]}
 
     @staticmethod
     def italic(content: str) -> Dict:
         """Italic text"""
-        return {"type": "text", "text": content, "marks": [{"type": "em"}]}
+        return {"type": "text", "text": content, "marks": [_EM_MARK]}
 
     @staticmethod
     def code(content: str) -> Dict:
         """Inline code"""
-        return {"type": "text", "text": content, "marks": [{"type": "code"}]}
+        return {"type": "text", "text": content, "marks": [_CODE_MARK]}
 
     @staticmethod
     def link(content: str, href: str) -> Dict:
@@ -146,11 +308,12 @@ class SubstackDocument:
             parts: Mix of strings and text nodes (from bold(), italic(), link(), etc.)
         """
         content = []
+        append = content.append
         for part in parts:
             if isinstance(part, str):
-                content.append(self.text(part))
+                append({"type": "text", "text": part})
             elif isinstance(part, dict):
-                content.append(part)
+                append(part)
 
         if content:
             self.content.append({"type": "paragraph", "content": content})
@@ -180,24 +343,13 @@ class SubstackDocument:
         image_node = {
             "type": "image2",
             "attrs": {
+                **self._IMG_ATTR_TEMPLATE,
                 "src": src,
-                "srcNoWatermark": None,
-                "fullscreen": None,
-                "imageSize": None,
                 "height": height,
                 "width": width,
-                "resizeWidth": None,
                 "bytes": bytes_size,
                 "alt": alt,
-                "title": None,
                 "type": content_type,
-                "href": None,
-                "belowTheFold": False,
-                "topImage": False,
-                "internalRedirect": None,  # Set by create_draft after we have draft_id
-                "isProcessing": False,
-                "align": None,
-                "offset": False
             }
         }
 
@@ -209,7 +361,7 @@ class SubstackDocument:
         if caption:
             self.content.append({
                 "type": "paragraph",
-                "content": [{"type": "text", "text": caption, "marks": [{"type": "em"}]}]
+                "content": [{"type": "text", "text": caption, "marks": [_EM_MARK]}]
             })
         return self
 
@@ -224,40 +376,34 @@ class SubstackDocument:
         })
         return self
 
-    def bullet_list(self, items: List[str]) -> 'SubstackDocument':
-        """Add a bullet list"""
-        list_items = []
-        for item in items:
-            list_items.append({
+    @staticmethod
+    def _list_items(items: List[str]) -> List[Dict]:
+        """Wrap each string in a listItem > paragraph > text node"""
+        return [
+            {
                 "type": "listItem",
                 "content": [{
                     "type": "paragraph",
                     "content": [{"type": "text", "text": item}]
                 }]
-            })
+            }
+            for item in items
+        ]
 
+    def bullet_list(self, items: List[str]) -> 'SubstackDocument':
+        """Add a bullet list"""
         self.content.append({
             "type": "bulletList",
-            "content": list_items
+            "content": self._list_items(items)
         })
         return self
 
     def numbered_list(self, items: List[str]) -> 'SubstackDocument':
         """Add a numbered/ordered list"""
-        list_items = []
-        for item in items:
-            list_items.append({
-                "type": "listItem",
-                "content": [{
-                    "type": "paragraph",
-                    "content": [{"type": "text", "text": item}]
-                }]
-            })
-
         self.content.append({
             "type": "orderedList",
             "attrs": {"order": 1},
-            "content": list_items
+            "content": self._list_items(items)
         })
         return self
 
@@ -312,16 +458,37 @@ class SubstackDocument:
 
     def to_json(self) -> str:
         """Build and serialize to JSON string"""
-        return json.dumps(self.build())
+        return _dumps(self.build())
 
 
 # =============================================================================
 # MARKDOWN TO SUBSTACK CONVERTER
 # =============================================================================
 
+_RE_HEADER = re.compile(r'^(#{1,4})\s+(.+)$')
+_RE_FENCE = re.compile(r'^```([^\s`]*)\s*$')
+_RE_IMG = re.compile(r'^!\[([^\]]*)\]\(([^)]+)\)$')
+_RE_NUM = re.compile(r'^\d+\.\s+(.+)$')
+_HR_MARKERS = frozenset({'---', '***', '___'})
+_BULLET_PREFIXES = ('- ', '* ')
+_RE_BULLET = re.compile(r'[-*] (.*)', re.DOTALL)
+# Characters that can open an inline span
+_RE_INLINE_MARKER = re.compile(r'[`*_\[]')
+# A single stripped line that no block or inline rule can match
+_RE_PLAIN_LINE = re.compile(r'[^#>\-\d`*_\[\n][^`*_\[\n]*')
+
+
 class MarkdownToSubstack:
     """Convert Markdown to Substack document format"""
 
+    __slots__ = ()
+
+    # Opt-in memoization for callers that convert the same input repeatedly
+    # (preview + save, retries). Results are decoded from cached JSON text, so
+    # every caller gets its own copy; a miss pays for the extra serialize and
+    # parse, which is why it is off for mostly-unique input like live appends.
+    _CACHE_ENABLED = False
+
     @staticmethod
     def convert(markdown: str) -> Dict:
         """
@@ -339,13 +506,29 @@ class MarkdownToSubstack:
         - Numbered lists (1. item)
         - Horizontal rules (---)
         """
+        # Short plain updates (common for live blogs) skip parsing entirely
+        stripped = markdown.strip()
+        if not stripped:
+            return {"type": "doc", "content": []}
+        if _RE_PLAIN_LINE.fullmatch(stripped):
+            return {"type": "doc", "content": [
+                {"type": "paragraph", "content": [{"type": "text", "text": stripped}]}]}
+        if MarkdownToSubstack._CACHE_ENABLED:
+            return _loads(_convert_to_json(markdown))
+        return MarkdownToSubstack._convert(markdown)
+
+    @staticmethod
+    def _convert(markdown: str) -> Dict:
+        """Uncached conversion behind convert()"""
         doc = SubstackDocument()
         lines = markdown.split('\n')
+        # Strip each line once; only code blocks need the raw line
+        stripped_lines = tuple(line.strip() for line in lines)
+        n = len(lines)
         i = 0
 
-        while i < len(lines):
-            line = lines[i]
-            stripped = line.strip()
+        while i < n:
+            stripped = stripped_lines[i]
 
             # Skip empty lines
             if not stripped:
@@ -353,28 +536,27 @@ class MarkdownToSubstack:
                 continue
 
             # Horizontal rule
-            if stripped in ['---', '***', '___']:
+            if stripped in _HR_MARKERS:
                 doc.horizontal_rule()
                 i += 1
                 continue
 
             # Headers (h1-h4)
-            header_match = re.match(r'^(#{1,4})\s+(.+)$', stripped)
+            header_match = _RE_HEADER.match(stripped)
             if header_match:
-                level = len(header_match.group(1))
-                text = header_match.group(2)
-                doc.heading(text, level=level)
+                hashes, text = header_match.groups()
+                doc.heading(text, level=len(hashes))
                 i += 1
                 continue
 
             # Fenced code blocks
-            code_match = re.match(r'^```([^\s`]*)\s*$', stripped)
+            code_match = _RE_FENCE.match(stripped)
             if code_match:
-                language = code_match.group(1) or ""
+                language = code_match[1] or ""
                 code_lines = []
                 i += 1
-                while i < len(lines):
-                    if lines[i].strip() == '```':
+                while i < n:
+                    if stripped_lines[i] == '```':
                         i += 1
                         break
                     code_lines.append(lines[i])
@@ -384,10 +566,9 @@ class MarkdownToSubstack:
                 continue
 
             # Images
-            img_match = re.match(r'^!\[([^\]]*)\]\(([^)]+)\)$', stripped)
+            img_match = _RE_IMG.match(stripped)
             if img_match:
-                alt = img_match.group(1)
-                src = img_match.group(2)
+                alt, src = img_match.groups()
                 doc.image(src, alt=alt)
                 i += 1
                 continue
@@ -395,46 +576,22 @@ class MarkdownToSubstack:
             # Blockquotes
             if stripped.startswith('> '):
                 quote_lines = []
-                while i < len(lines) and lines[i].strip().startswith('> '):
-                    quote_lines.append(lines[i].strip()[2:])
+                while i < n and stripped_lines[i].startswith('> '):
+                    quote_lines.append(stripped_lines[i][2:])
                     i += 1
                 doc.blockquote(' '.join(quote_lines))
                 continue
 
             # Bullet lists
-            if stripped.startswith('- ') or stripped.startswith('* '):
-                items = []
-                while i < len(lines):
-                    l = lines[i].strip()
-                    if l.startswith('- ') or l.startswith('* '):
-                        items.append(l[2:])
-                        i += 1
-                    elif l == '':
-                        i += 1
-                        break
-                    else:
-                        break
-                if items:
-                    doc.bullet_list(items)
+            if stripped.startswith(_BULLET_PREFIXES):
+                items, i = MarkdownToSubstack._consume_list(stripped_lines, i, _RE_BULLET)
+                doc.bullet_list(items)
                 continue
 
             # Numbered lists
-            num_match = re.match(r'^\d+\.\s+(.+)$', stripped)
-            if num_match:
-                items = []
-                while i < len(lines):
-                    l = lines[i].strip()
-                    m = re.match(r'^\d+\.\s+(.+)$', l)
-                    if m:
-                        items.append(m.group(1))
-                        i += 1
-                    elif l == '':
-                        i += 1
-                        break
-                    else:
-                        break
-                if items:
-                    doc.numbered_list(items)
+            if _RE_NUM.match(stripped):
+                items, i = MarkdownToSubstack._consume_list(stripped_lines, i, _RE_NUM)
+                doc.numbered_list(items)
                 continue
 
             # Regular paragraph - parse inline formatting
@@ -449,70 +606,158 @@ class MarkdownToSubstack:
         return doc.build()
 
     @staticmethod
-    def _parse_inline(text: str) -> List[Dict]:
-        """Parse inline formatting (code, bold, italic, links)"""
-        content = []
+    def _consume_list(stripped_lines: tuple, i: int, pattern: re.Pattern) -> tuple:
+        """
+        Collect consecutive list items starting at line i.
 
-        # Pattern for links, bold, italic
-        pattern = r'(`([^`]+)`|\*\*(.+?)\*\*|\*(.+?)\*|_(.+?)_|\[([^\]]+)\]\(([^)]+)\))'
+        Stops after the first blank line (which is consumed) or at the first
+        line that does not match pattern. Returns (items, next line index).
+        """
+        items = []
+        n = len(stripped_lines)
+        match = pattern.match
+        while i < n:
+            line = stripped_lines[i]
+            m = match(line)
+            if m:
+                items.append(m[1])
+                i += 1
+            elif not line:
+                i += 1
+                break
+            else:
+                break
+        return items, i
 
-        last_end = 0
-        for match in re.finditer(pattern, text):
-            # Add text before match
-            if match.start() > last_end:
-                content.append({"type": "text", "text": text[last_end:match.start()]})
+    @staticmethod
+    def _parse_inline(text: str) -> List[Dict]:
+        """
+        Parse inline formatting (code, bold, italic, links).
 
-            full_match = match.group(0)
+        Single left-to-right scan over the line. Plain text between marker
+        characters is skipped with a compiled search rather than walked char
+        by char. At each marker the candidates are tried in the same order the
+        old regex alternation used (code, bold, italic, link); unmatched
+        markers are kept as plain text.
+        """
+        content = []
+        n = len(text)
+        find = text.find
+        next_marker = _RE_INLINE_MARKER.search
+        plain_start = 0
+        line_end = -1
+        i = 0
 
-            if full_match.startswith('`'):
-                # Inline code
-                content.append({
-                    "type": "text",
-                    "text": match.group(2),
-                    "marks": [{"type": "code"}]
-                })
-            elif full_match.startswith('**'):
-                # Bold
-                content.append({
-                    "type": "text",
-                    "text": match.group(3),
-                    "marks": [{"type": "strong"}]
-                })
-            elif full_match.startswith('['):
-                # Link
-                link_text = match.group(6)
-                link_url = match.group(7)
-                content.append({
-                    "type": "text",
-                    "text": link_text,
-                    "marks": [{"type": "link", "attrs": {"href": link_url, "title": None}}]
-                })
-            elif full_match.startswith('*') or full_match.startswith('_'):
-                # Italic
-                italic_text = match.group(4) or match.group(5)
-                content.append({
-                    "type": "text",
-                    "text": italic_text,
-                    "marks": [{"type": "em"}]
-                })
+        while True:
+            m = next_marker(text, i)
+            if m is None:
+                break
+            i = m.start()
+            ch = text[i]
+            if i > line_end:
+                # Emphasis spans cannot cross a newline
+                line_end = find('\n', i)
+                if line_end == -1:
+                    line_end = n
+            node = None
+
+            if ch == '`':
+                # Inline code: `text`
+                j = find('`', i + 1)
+                if j > i + 1:
+                    node = {"type": "text", "text": text[i + 1:j], "marks": [_CODE_MARK]}
+                    end = j + 1
+            elif ch == '*':
+                # Bold: **text**, falling back to italic: *text*
+                if text.startswith('*', i + 1):
+                    j = find('**', i + 3, line_end)
+                    if j != -1:
+                        node = {"type": "text", "text": text[i + 2:j], "marks": [_STRONG_MARK]}
+                        end = j + 2
+                if node is None:
+                    j = find('*', i + 2, line_end)
+                    if j != -1:
+                        node = {"type": "text", "text": text[i + 1:j], "marks": [_EM_MARK]}
+                        end = j + 1
+            elif ch == '_':
+                # Italic: _text_
+                j = find('_', i + 2, line_end)
+                if j != -1:
+                    node = {"type": "text", "text": text[i + 1:j], "marks": [_EM_MARK]}
+                    end = j + 1
+            elif ch == '[':
+                # Link: [text](url)
+                j = find(']', i + 1)
+                if j > i + 1 and text.startswith('(', j + 1):
+                    k = find(')', j + 2)
+                    if k > j + 2:
+                        node = {
+                            "type": "text",
+                            "text": text[i + 1:j],
+                            "marks": [{"type": "link", "attrs": {"href": text[j + 2:k], "title": None}}]
+                        }
+                        end = k + 1
+
+            if node is None:
+                i += 1
+                continue
 
-            last_end = match.end()
+            # Add text before the formatted span
+            if i > plain_start:
+                content.append({"type": "text", "text": text[plain_start:i]})
+            content.append(node)
+            i = plain_start = end
 
         # Add remaining text
-        if last_end < len(text):
-            content.append({"type": "text", "text": text[last_end:]})
-
-        # If no formatting found, just return plain text
-        if not content and text:
-            content.append({"type": "text", "text": text})
+        if plain_start < n:
+            content.append({"type": "text", "text": text[plain_start:]})
 
         return content
 
 
+@functools.lru_cache(maxsize=128)
+def _convert_to_json(markdown: str) -> str:
+    """Convert markdown once and keep the result as immutable JSON text"""
+    return _dumps(MarkdownToSubstack._convert(markdown))
+
+
 # =============================================================================
 # SUBSTACK API CLIENT
 # =============================================================================
 
+# Column layout for get_archive_columnar: id and the count fields become
+# array('q') columns (missing counts read as 0), text fields plain lists
+# (bodies are opt-in)
+_ARCHIVE_COUNT_COLUMNS = ("comment_count", "wordcount")
+_ARCHIVE_TEXT_COLUMNS = ("title", "slug", "subtitle", "canonical_url", "post_date",
+                         "audience", "cover_image", "type")
+
+_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15"
+
+# Headers shared by every request; set once on the session, so requests only
+# pass per-call deltas such as If-None-Match
+_HEADERS_TEMPLATE = {
+    "Accept": "application/json",
+    "Content-Type": "application/json",
+    "User-Agent": _USER_AGENT,
+}
+
+# Body used to create a draft before its ID is known (see create_draft)
+_PLACEHOLDER_BODY = _dumps({
+    "type": "doc",
+    "content": [{"type": "paragraph", "content": [{"type": "text", "text": "..."}]}]
+})
+
+# Image upload read size; a multiple of 3 so base64 chunks concatenate cleanly
+_IMAGE_READ_CHUNK = 3 * 64 * 1024
+
+
+@functools.lru_cache(maxsize=256)
+def _guess_mime(path: str) -> str:
+    """MIME type for an image path, defaulting to PNG"""
+    return mimetypes.guess_type(path)[0] or 'image/png'
+
+
 class SubstackClient:
     """
     Full-featured Substack API client.
@@ -542,62 +787,141 @@ class SubstackClient:
         # Publish
         post = client.publish_draft(draft.id)
         print(f"Published: {post.canonical_url}")
+
+    A preconfigured requests.Session (for example one with a custom transport
+    adapter mounted, or shared between clients) can be passed as `session`.
+    The client sends its auth headers with each request rather than setting
+    them on the session, and leaves closing it to the caller.
     """
 
-    def __init__(self, token: str, publication: str, rate_limit: float = 0.5, timeout: float = 30.0):
+    def __init__(self, token: str, publication: str, rate_limit: float = 0.5, timeout: float = 30.0,
+                 burst: int = 3, session: Optional[requests.Session] = None):
         self.token = token
         self.publication = publication.replace("https://", "").replace("http://", "")
         self.rate_limit = rate_limit
         self.timeout = timeout
-        self._last_request = 0
+        # One request per rate_limit seconds on average, with short bursts allowed
+        self._bucket = _TokenBucket(1 / rate_limit, burst) if rate_limit > 0 else None
 
         # Base URLs
         self.pub_base = f"https://{self.publication}/api/v1"
         self.sub_base = "https://substack.com/api/v1"
+        self.edit_base = f"https://{self.publication}/publish/post/"
 
         # Headers
-        self.headers = {
-            "Cookie": f"substack.sid={token}",
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15",
-        }
+        self.headers = {"Cookie": f"substack.sid={token}", **_HEADERS_TEMPLATE}
+
+        # Pooled HTTP session (reuses TCP/TLS connections across calls)
+        self._owns_session = session is None
+        self._session = _build_session() if session is None else session
 
         # Cache
         self._user_id: Optional[int] = None
+        self._handle: Optional[str] = None
+        self._profile: Optional[SubstackProfile] = None
+        # url -> (ETag, raw response body) for conditional GETs
+        self._etag_cache: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._etag_lock = threading.Lock()
+
+    def close(self):
+        """Close pooled HTTP connections (unless the session was passed in)"""
+        if self._owns_session:
+            self._session.close()
+
+    def invalidate_cache(self):
+        """Forget cached identity and conditional-GET data (e.g. after rotating the token)"""
+        self._user_id = None
+        self._handle = None
+        self._profile = None
+        with self._etag_lock:
+            self._etag_cache.clear()
+
+    def __enter__(self) -> 'SubstackClient':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def _rate_limit_wait(self):
-        """Respect rate limits"""
-        elapsed = time.time() - self._last_request
-        if elapsed < self.rate_limit:
-            time.sleep(self.rate_limit - elapsed)
-        self._last_request = time.time()
+        """Respect rate limits (safe to call from several threads)"""
+        if self._bucket is not None:
+            self._bucket.take()
+
+    def _send(self, send, url: str, **kwargs) -> requests.Response:
+        """
+        Rate-limited request via a session method, retrying on 429.
+
+        Throttled responses are retried after Retry-After (or an exponential
+        backoff when the header is missing or a date) and slow the bucket down;
+        other responses let it recover.
+        """
+        extra = kwargs.pop("headers", None)
+        kwargs["headers"] = {**self.headers, **extra} if extra else self.headers
+        for attempt in range(_MAX_THROTTLE_RETRIES + 1):
+            self._rate_limit_wait()
+            r = send(url, timeout=self.timeout, **kwargs)
+            if r.status_code != 429:
+                if self._bucket is not None:
+                    self._bucket.speed_up()
+                return r
+            if self._bucket is not None:
+                self._bucket.slow_down()
+            if attempt < _MAX_THROTTLE_RETRIES:
+                try:
+                    delay = float(r.headers.get("Retry-After"))
+                except (TypeError, ValueError):
+                    delay = 2 ** attempt
+                if not math.isfinite(delay):
+                    delay = 2 ** attempt
+                time.sleep(max(0.0, min(delay, 60)))
+        return r
 
     def _get(self, base: str, path: str) -> Dict:
-        """GET request"""
-        self._rate_limit_wait()
-        r = requests.get(f"{base}{path}", headers=self.headers, timeout=self.timeout)
+        """
+        GET request.
+
+        Responses that carry an ETag are remembered, and later GETs of the same
+        URL send If-None-Match so an unchanged resource comes back as an empty
+        304. The raw body is cached and decoded again on a hit so callers never
+        share (and mutate) the same parsed object. Only the most recently used
+        _ETAG_CACHE_SIZE URLs are kept.
+        """
+        url = f"{base}{path}"
+        with self._etag_lock:
+            cached = self._etag_cache.get(url)
+            if cached:
+                self._etag_cache.move_to_end(url)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        r = self._send(self._session.get, url, headers=headers)
+        if cached and r.status_code == 304:
+            return _loads(cached[1])
         r.raise_for_status()
-        return r.json()
+
+        etag = r.headers.get("ETag")
+        if etag:
+            with self._etag_lock:
+                self._etag_cache[url] = (etag, r.content)
+                self._etag_cache.move_to_end(url)
+                if len(self._etag_cache) > _ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+        return _loads(r.content)
 
     def _post(self, base: str, path: str, data: Dict) -> Dict:
         """POST request"""
-        self._rate_limit_wait()
-        r = requests.post(f"{base}{path}", headers=self.headers, json=data, timeout=self.timeout)
+        r = self._send(self._session.post, f"{base}{path}", data=_dumpb(data))
         r.raise_for_status()
-        return r.json()
+        return _loads(r.content)
 
     def _put(self, base: str, path: str, data: Dict) -> Dict:
         """PUT request"""
-        self._rate_limit_wait()
-        r = requests.put(f"{base}{path}", headers=self.headers, json=data, timeout=self.timeout)
+        r = self._send(self._session.put, f"{base}{path}", data=_dumpb(data))
         r.raise_for_status()
-        return r.json()
+        return _loads(r.content)
 
     def _delete(self, base: str, path: str) -> bool:
         """DELETE request"""
-        self._rate_limit_wait()
-        r = requests.delete(f"{base}{path}", headers=self.headers, timeout=self.timeout)
+        r = self._send(self._session.delete, f"{base}{path}")
         return r.status_code in [200, 204]
 
     @staticmethod
@@ -621,36 +945,58 @@ class SubstackClient:
             return SubstackClient._ensure_doc_structure(raw_body)
         if isinstance(raw_body, str):
             try:
-                parsed = json.loads(raw_body)
-            except Exception as exc:
+                parsed = _loads(raw_body)
+            except ValueError as exc:
                 raise ValueError(f"Could not parse draft_body JSON: {exc}") from exc
             if not isinstance(parsed, dict):
                 raise ValueError("draft_body JSON is not an object")
             return SubstackClient._ensure_doc_structure(parsed)
         raise ValueError(f"Unsupported draft_body type: {type(raw_body).__name__}")
 
+    @staticmethod
+    def _needs_internal_redirects(node: Any) -> bool:
+        """True if any image node still lacks an internalRedirect"""
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(node)
+                continue
+            if not isinstance(node, dict):
+                continue
+            if node.get("type") == "image2":
+                attrs = node.get("attrs") or {}
+                if attrs.get("src") and not attrs.get("internalRedirect"):
+                    return True
+            content = node.get("content")
+            if isinstance(content, list):
+                stack.extend(content)
+        return False
+
     def _fix_internal_redirects(self, node: Any, draft_id: int) -> None:
         """Ensure image nodes include internalRedirect"""
-        import urllib.parse
-
-        if isinstance(node, list):
-            for child in node:
-                self._fix_internal_redirects(child, draft_id)
-            return
-        if not isinstance(node, dict):
-            return
-
-        if node.get("type") == "image2":
-            attrs = node.setdefault("attrs", {})
-            src = attrs.get("src", "")
-            if src and not attrs.get("internalRedirect"):
-                encoded_url = urllib.parse.quote(src, safe='')
-                attrs["internalRedirect"] = f"https://{self.publication}/i/{draft_id}?img={encoded_url}"
-
-        content = node.get("content")
-        if isinstance(content, list):
-            for child in content:
-                self._fix_internal_redirects(child, draft_id)
+        redirect_prefix = f"https://{self.publication}/i/{draft_id}?img="
+        # quote() only encodes to UTF-8 and forwards here
+        quote = urllib.parse.quote_from_bytes
+        stack = [node]
+        pop, extend = stack.pop, stack.extend
+        while stack:
+            node = pop()
+            if isinstance(node, list):
+                extend(node)
+                continue
+            if not isinstance(node, dict):
+                continue
+
+            if node.get("type") == "image2":
+                attrs = node.setdefault("attrs", {})
+                src = attrs.get("src", "")
+                if src and not attrs.get("internalRedirect"):
+                    attrs["internalRedirect"] = redirect_prefix + quote(src.encode(), b'')
+
+            content = node.get("content")
+            if isinstance(content, list):
+                extend(content)
 
     def upload_image(self, image_path: str) -> Dict:
         """
@@ -662,32 +1008,14 @@ class SubstackClient:
         Returns:
             Dict with keys: url, width, height, bytes, contentType
         """
-        import base64
-        import mimetypes
-
-        # Read and encode the image
-        with open(image_path, 'rb') as f:
-            image_data = f.read()
-
         # Detect mime type
-        mime_type, _ = mimetypes.guess_type(image_path)
-        if not mime_type:
-            mime_type = 'image/png'
-
-        # Create data URI
-        b64_data = base64.b64encode(image_data).decode('utf-8')
-        data_uri = f"data:{mime_type};base64,{b64_data}"
+        mime_type = _guess_mime(image_path)
 
         # Upload to Substack (must use JSON format)
-        self._rate_limit_wait()
-        r = requests.post(
-            f"{self.pub_base}/image",
-            headers=self.headers,
-            json={"image": data_uri},
-            timeout=self.timeout
-        )
+        body = self._image_upload_body(image_path, mime_type)
+        r = self._send(self._session.post, f"{self.pub_base}/image", data=body)
         r.raise_for_status()
-        result = r.json()
+        result = _loads(r.content)
         return {
             "url": result.get("url", ""),
             "width": result.get("imageWidth"),
@@ -696,18 +1024,61 @@ class SubstackClient:
             "contentType": result.get("contentType")
         }
 
+    @staticmethod
+    def _image_upload_body(image_path: str, mime_type: str,
+                           chunk_size: int = _IMAGE_READ_CHUNK) -> bytearray:
+        """
+        Build the {"image": "data:...;base64,..."} JSON body for an upload.
+
+        The file is read and base64-encoded chunk by chunk straight into one
+        buffer, so the raw bytes, the base64 text and the JSON body are never
+        all held in memory at once. Base64 output needs no JSON escaping.
+        """
+        body = bytearray(b'{"image":"data:')
+        body += mime_type.encode('ascii')
+        body += b';base64,'
+        with open(image_path, 'rb') as f:
+            while chunk := f.read(chunk_size):
+                body += base64.b64encode(chunk)
+        body += b'"}'
+        return body
+
+    @staticmethod
+    def _map_concurrent(fn, args: List[Any], max_workers: int) -> List[Any]:
+        """
+        Call fn for each argument on a thread pool and return results in order.
+
+        Requests overlap on the wire while the shared session and rate limiter
+        keep connection reuse and request spacing intact.
+        """
+        if len(args) <= 1:
+            return [fn(arg) for arg in args]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(args))) as pool:
+            return list(pool.map(fn, args))
+
+    def upload_images(self, image_paths: List[str], max_workers: int = 4) -> List[Dict]:
+        """
+        Upload several local images concurrently.
+
+        Uploads share the client's connection pool and rate limit; results are
+        returned in the same order as image_paths.
+        """
+        return self._map_concurrent(self.upload_image, image_paths, max_workers)
+
     # --- Authentication & Profile ---
 
     def test_connection(self) -> bool:
-        """Test if connected with valid credentials"""
+        """Test if connected with valid credentials (also caches the user ID)"""
         try:
-            self._put(self.sub_base, "/user-setting", {
+            r = self._put(self.sub_base, "/user-setting", {
                 "type": "last_home_tab",
                 "value_text": "inbox"
             })
-            return True
-        except:
+        except (requests.RequestException, ValueError):
             return False
+        if isinstance(r, dict) and r.get("user_id"):
+            self._user_id = r["user_id"]
+        return True
 
     def get_user_id(self) -> int:
         """Get authenticated user's ID"""
@@ -722,23 +1093,29 @@ class SubstackClient:
 
     def get_handle(self) -> str:
         """Get authenticated user's handle"""
+        if self._handle:
+            return self._handle
         r = self._get(self.sub_base, "/handle/options")
         for h in r.get("potentialHandles", []):
             if h.get("type") == "existing":
-                return h.get("handle")
+                self._handle = h.get("handle")
+                return self._handle
         raise ValueError("Could not find handle")
 
     def get_profile(self) -> SubstackProfile:
         """Get authenticated user's profile"""
+        if self._profile:
+            return self._profile
         handle = self.get_handle()
         r = self._get(self.sub_base, f"/user/{handle}/public_profile")
-        return SubstackProfile(
+        self._profile = SubstackProfile(
             id=r["id"],
             name=r["name"],
             handle=r["handle"],
             photo_url=r.get("photo_url", ""),
             bio=r.get("bio", "")
         )
+        return self._profile
 
     def get_user_profile(self, handle: str) -> Dict:
         """
@@ -787,46 +1164,48 @@ class SubstackClient:
     def get_archive(self, limit: int = 50) -> List[SubstackPost]:
         """Get published posts"""
         r = self._get(self.pub_base, f"/archive?sort=new&limit={limit}")
-        posts = []
-        for p in r:
-            posts.append(SubstackPost(
-                id=p["id"],
-                title=p.get("title", ""),
-                slug=p.get("slug", ""),
-                subtitle=p.get("subtitle", ""),
-                body_html=p.get("body_html", ""),
-                body_json=p.get("body_json", {}),
-                canonical_url=p.get("canonical_url", ""),
-                post_date=p.get("post_date", ""),
-                audience=p.get("audience", "everyone"),
-                reactions=p.get("reactions", {}),
-                comment_count=p.get("comment_count", 0),
-                wordcount=p.get("wordcount", 0),
-                cover_image=p.get("cover_image", ""),
-                type=p.get("type", "newsletter")
-            ))
-        return posts
+        return [SubstackPost.from_api(p) for p in r]
+
+    def get_archive_columnar(self, limit: int = 50, include_bodies: bool = False) -> Dict[str, Any]:
+        """
+        Get published posts as columns instead of SubstackPost objects.
+
+        id, comment_count and wordcount are array('q') columns of machine ints
+        (e.g. sum(cols["wordcount"])); the other fields are index-aligned lists.
+        body_html/body_json make up most of each post and are only included
+        when include_bodies is True.
+        """
+        r = self._get(self.pub_base, f"/archive?sort=new&limit={limit}")
+        defaults = dict(SubstackPost._API_DEFAULTS)
+        # Like SubstackPost.from_api, a post without an id is an error
+        columns: Dict[str, Any] = {"id": array('q', [p["id"] for p in r])}
+        for name in _ARCHIVE_COUNT_COLUMNS:
+            columns[name] = array('q', [p.get(name) or 0 for p in r])
+        for name in _ARCHIVE_TEXT_COLUMNS:
+            default = defaults[name]
+            columns[name] = [p.get(name, default) for p in r]
+        if include_bodies:
+            columns["body_html"] = [p.get("body_html", "") for p in r]
+            columns["body_json"] = [p.get("body_json", {}) for p in r]
+        return columns
 
     def get_post(self, post_id: int) -> SubstackPost:
         """Get a single post by ID"""
         r = self._get(self.sub_base, f"/posts/by-id/{post_id}")
-        p = r.get("post", r)
-        return SubstackPost(
-            id=p["id"],
-            title=p.get("title", ""),
-            slug=p.get("slug", ""),
-            subtitle=p.get("subtitle", ""),
-            body_html=p.get("body_html", ""),
-            body_json=p.get("body_json", {}),
-            canonical_url=p.get("canonical_url", ""),
-            post_date=p.get("post_date", ""),
-            audience=p.get("audience", "everyone"),
-            reactions=p.get("reactions", {}),
-            comment_count=p.get("comment_count", 0),
-            wordcount=p.get("wordcount", 0),
-            cover_image=p.get("cover_image", ""),
-            type=p.get("type", "newsletter")
-        )
+        return SubstackPost.from_api(r.get("post", r))
+
+    def get_posts(self, post_ids: List[int], max_workers: int = 8) -> List[SubstackPost]:
+        """Get several posts by ID concurrently, in the order given"""
+        return self._map_concurrent(self.get_post, post_ids, max_workers)
+
+    def get_archive_full(self, limit: int = 50, max_workers: int = 8) -> List[SubstackPost]:
+        """
+        Get published posts with their full bodies.
+
+        Archive entries are summaries, so each post is then fetched by ID
+        concurrently (see get_posts); results keep the archive order.
+        """
+        return self.get_posts([p.id for p in self.get_archive(limit)], max_workers)
 
     # --- Drafts ---
 
@@ -872,13 +1251,14 @@ class SubstackClient:
 
         user_id = self.get_user_id()
 
-        # Create draft with placeholder first to get ID
-        placeholder = {"type": "doc", "content": [{"type": "paragraph", "content": [{"type": "text", "text": "..."}]}]}
+        # Image internalRedirect URLs embed the draft ID, so drafts with images
+        # are created with a placeholder first; others are created in one call.
+        needs_redirects = self._needs_internal_redirects(body_json.get("content", []))
         data = {
             "type": "newsletter",
             "draft_title": title,
             "draft_subtitle": subtitle,
-            "draft_body": json.dumps(placeholder),
+            "draft_body": _PLACEHOLDER_BODY if needs_redirects else _dumps(body_json),
             "draft_bylines": [{"id": user_id, "is_guest": False}],
             "audience": audience
         }
@@ -889,11 +1269,12 @@ class SubstackClient:
         r = self._post(self.pub_base, "/drafts", data)
         draft_id = r["id"]
 
-        # Fix up internalRedirect URLs for any images
-        self._fix_internal_redirects(body_json.get("content", []), draft_id)
+        if needs_redirects:
+            # Fix up internalRedirect URLs for any images
+            self._fix_internal_redirects(body_json.get("content", []), draft_id)
 
-        # Update draft with corrected body
-        self._put(self.pub_base, f"/drafts/{draft_id}", {"draft_body": json.dumps(body_json)})
+            # Update draft with corrected body
+            self._put(self.pub_base, f"/drafts/{draft_id}", {"draft_body": _dumps(body_json)})
 
         return SubstackDraft(
             id=draft_id,
@@ -926,7 +1307,7 @@ class SubstackClient:
                 body_json = body
             body_json = self._ensure_doc_structure(body_json)
             self._fix_internal_redirects(body_json.get("content", []), draft_id)
-            data["draft_body"] = json.dumps(body_json)
+            data["draft_body"] = _dumps(body_json)
 
         return self._put(self.pub_base, f"/drafts/{draft_id}", data)
 
@@ -1013,36 +1394,38 @@ class SubstackClient:
         - First # heading becomes title
         - First **bold** line after title becomes subtitle
         """
-        lines = markdown.strip().split('\n')
-
-        # Extract title if not provided
-        if not title:
-            for line in lines:
-                if line.startswith('# '):
-                    title = line[2:].strip()
-                    break
-            title = title or "Untitled"
-
-        # Extract subtitle if not provided
-        if not subtitle:
-            for line in lines:
-                if line.startswith('**') and line.endswith('**'):
-                    subtitle = line[2:-2].strip()
-                    break
-
-        # Remove title/subtitle from body
+        # Title and subtitle are extracted and stripped from the body in one pass.
+        # Any line that repeats the title/subtitle comes at or after the first
+        # "# "/"**" line that defines it, so each value is known by the time a
+        # line could need removing.
+        seeking_title = not title
+        seeking_subtitle = not subtitle
+        subtitle_line = f"**{subtitle}**" if subtitle else None
         body_lines = []
+        append = body_lines.append
         skip_next_hr = False
-        for line in lines:
-            if line.startswith('# ') and line[2:].strip() == title:
-                continue
-            if subtitle and line == f"**{subtitle}**":
-                skip_next_hr = True
-                continue
-            if skip_next_hr and line.strip() == '---':
+        for line in markdown.strip().split('\n'):
+            if line.startswith('# '):
+                if seeking_title:
+                    title = line[2:].strip() or "Untitled"
+                    seeking_title = False
+                if line[2:].strip() == title:
+                    continue
+            elif line.startswith('**'):
+                if seeking_subtitle and line.endswith('**'):
+                    subtitle = line[2:-2].strip()
+                    subtitle_line = f"**{subtitle}**" if subtitle else None
+                    seeking_subtitle = False
+                if line == subtitle_line:
+                    skip_next_hr = True
+                    continue
+            elif skip_next_hr and line.strip() == '---':
                 skip_next_hr = False
                 continue
-            body_lines.append(line)
+            append(line)
+
+        if seeking_title:
+            title = "Untitled"
 
         body_md = '\n'.join(body_lines)
 
@@ -1141,14 +1524,36 @@ class LiveBlogSession:
         session.add_milestone("Authentication Complete")
 
         session.end(publish=True)
+
+    The draft body is kept locally after start(), so each update is a single
+    PUT rather than a GET followed by a PUT. With flush_interval > 0, updates
+    made within that many seconds are batched into one PUT; end() and flush()
+    write any pending updates immediately. A failed batched write keeps the
+    updates pending, so flush() or end() can simply be called again.
     """
 
-    def __init__(self, client: SubstackClient):
+    def __init__(self, client: SubstackClient, flush_interval: float = 0.0):
         self.client = client
+        self.flush_interval = flush_interval
         self.draft_id: Optional[int] = None
         self.title: str = ""
         self.update_count: int = 0
         self.started_at: Optional[datetime] = None
+        self._body_cache: Optional[Dict] = None
+        self._dirty = False
+        self._closing_added = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+        # (epoch second, format, formatted text) of the last timestamp
+        self._ts_cache: tuple = (0, "", "")
+
+    def _now_str(self, fmt: str = '%I:%M:%S %p') -> str:
+        """Current local time formatted with fmt, reformatted at most once a second"""
+        now = int(time.time())
+        cached = self._ts_cache
+        if cached[0] != now or cached[1] != fmt:
+            cached = self._ts_cache = (now, fmt, time.strftime(fmt, time.localtime(now)))
+        return cached[2]
 
     @property
     def active(self) -> bool:
@@ -1162,7 +1567,7 @@ class LiveBlogSession:
         doc = SubstackDocument()
         doc.paragraph(
             doc.bold("Live Blog Started"),
-            f" at {datetime.now().strftime('%I:%M %p')}"
+            f" at {self._now_str('%I:%M %p')}"
         )
         doc.horizontal_rule()
 
@@ -1172,34 +1577,81 @@ class LiveBlogSession:
         self.title = title
         self.update_count = 0
         self.started_at = datetime.now()
+        self._body_cache = draft.body_json
+        self._dirty = False
+        self._closing_added = False
 
         return draft.id
 
+    def _load_body(self) -> Dict:
+        """Return the cached draft body, fetching it if the cache is cold"""
+        if self._body_cache is None:
+            draft_data = self.client.get_draft(self.draft_id)
+            current_body = draft_data.get("body_json") or draft_data.get("draft_body", "{}")
+            try:
+                self._body_cache = SubstackClient._parse_draft_body(current_body)
+            except ValueError as exc:
+                raise RuntimeError(str(exc)) from exc
+        return self._body_cache
+
+    def _write(self):
+        """PUT the cached body; on failure it stays cached and dirty"""
+        self.client.update_draft(draft_id=self.draft_id, body=self._body_cache)
+        self._dirty = False
+
     def _append_content(self, content: List[Dict]):
         """Append content nodes to the draft"""
-        if not self.active:
-            raise RuntimeError("No active session")
+        with self._lock:
+            if not self.active:
+                raise RuntimeError("No active session")
 
-        draft_data = self.client.get_draft(self.draft_id)
-        current_body = draft_data.get("body_json") or draft_data.get("draft_body", "{}")
-
-        try:
-            body_json = SubstackClient._parse_draft_body(current_body)
-        except ValueError as exc:
-            raise RuntimeError(str(exc)) from exc
+            body_json = self._load_body()
 
-        # Add timestamp
-        body_json["content"].append({
-            "type": "paragraph",
-            "content": [{"type": "text", "text": f"[{datetime.now().strftime('%I:%M:%S %p')}]",
-                        "marks": [{"type": "code"}]}]
-        })
+            # Add timestamp
+            body_json["content"].append({
+                "type": "paragraph",
+                "content": [{"type": "text", "text": f"[{self._now_str()}]",
+                            "marks": [{"type": "code"}]}]
+            })
 
-        # Add new content
-        body_json["content"].extend(content)
+            # Add new content
+            body_json["content"].extend(content)
 
-        self.client.update_draft(draft_id=self.draft_id, body=body_json)
-        self.update_count += 1
+            if self.flush_interval > 0:
+                self._dirty = True
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(self.flush_interval, self._timed_flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+            else:
+                try:
+                    self._write()
+                except Exception:
+                    # The caller sees this update fail; re-fetch the server copy
+                    self._body_cache = None
+                    self._dirty = False
+                    raise
+            self.update_count += 1
+
+    def _timed_flush(self):
+        """Timer callback; a failed write stays pending for the next flush()"""
+        with self._lock:
+            self._flush_timer = None
+            if not self._dirty or not self.active:
+                return
+            try:
+                self._write()
+            except Exception:
+                return
+
+    def flush(self):
+        """Write any batched updates to the draft now"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._dirty and self.active:
+                self._write()
 
     def add_update(self, text: str):
         """Add a text update"""
@@ -1245,19 +1697,21 @@ class LiveBlogSession:
         if not self.active:
             raise RuntimeError("No active session")
 
-        # Add closing
         duration = datetime.now() - self.started_at if self.started_at else None
         duration_str = str(duration).split('.')[0] if duration else "unknown"
 
-        doc = SubstackDocument()
-        doc.horizontal_rule()
-        doc.paragraph(
-            doc.bold("Live Blog Ended"),
-            f" at {datetime.now().strftime('%I:%M %p')}"
-        )
-        doc.paragraph(f"Duration: {duration_str} | Updates: {self.update_count}")
-
-        self._append_content(doc.build()["content"])
+        # Add closing; a retry after a failed flush or publish must not add a second one
+        if not self._closing_added:
+            doc = SubstackDocument()
+            doc.horizontal_rule()
+            doc.paragraph(
+                doc.bold("Live Blog Ended"),
+                f" at {self._now_str('%I:%M %p')}"
+            )
+            doc.paragraph(f"Duration: {duration_str} | Updates: {self.update_count}")
+            self._append_content(doc.build()["content"])
+            self._closing_added = True
+        self.flush()
 
         result = {
             "draft_id": self.draft_id,
@@ -1276,6 +1730,8 @@ class LiveBlogSession:
         self.title = ""
         self.update_count = 0
         self.started_at = None
+        self._body_cache = None
+        self._closing_added = False
 
         return result
 
@@ -1284,6 +1740,29 @@ class LiveBlogSession:
 # CONVENIENCE FUNCTIONS
 # =============================================================================
 
+# Clients reused by quick_publish, keyed by (token, publication), so repeated
+# calls share one connection pool, rate limiter and identity cache
+_CLIENT_CACHE: Dict[tuple, SubstackClient] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _cached_client(token: str, publication: str) -> SubstackClient:
+    key = (token, publication)
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = _CLIENT_CACHE[key] = SubstackClient(token, publication)
+        return client
+
+
+@atexit.register
+def _close_cached_clients():
+    with _CLIENT_CACHE_LOCK:
+        for client in _CLIENT_CACHE.values():
+            client.close()
+        _CLIENT_CACHE.clear()
+
+
 def quick_publish(token: str, publication: str, markdown_file: str,
                  send_email: bool = False) -> str:
     """
@@ -1294,7 +1773,7 @@ def quick_publish(token: str, publication: str, markdown_file: str,
     with open(markdown_file, 'r') as f:
         content = f.read()
 
-    client = SubstackClient(token, publication)
+    client = _cached_client(token, publication)
     result = client.publish_markdown(content, send_email=send_email)
 
     return result.get("canonical_url", "")
@@ -1315,18 +1794,22 @@ if __name__ == "__main__":
         print("Set SUBSTACK_SID and SUBSTACK_PUBLICATION environment variables")
         sys.exit(1)
 
-    client = SubstackClient(token, pub)
-
-    if client.test_connection():
-        profile = client.get_profile()
-        print(f"✅ Connected as {profile.name} (@{profile.handle})")
-
-        # Show some stats
-        posts = client.get_archive(limit=5)
-        drafts = client.get_drafts()
-
-        print(f"\n📊 Stats:")
-        print(f"   Posts: {len(posts)}+ published")
-        print(f"   Drafts: {len(drafts)} pending")
-    else:
-        print("❌ Connection failed")
+    with SubstackClient(token, pub) as client:
+        if client.test_connection():
+            # Independent lookups; run them side by side on the pooled session
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                profile_f = pool.submit(client.get_profile)
+                posts_f = pool.submit(client.get_archive, limit=5)
+                drafts_f = pool.submit(client.get_drafts)
+            profile = profile_f.result()
+            print(f"✅ Connected as {profile.name} (@{profile.handle})")
+
+            # Show some stats
+            posts = posts_f.result()
+            drafts = drafts_f.result()
+
+            print(f"\n📊 Stats:")
+            print(f"   Posts: {len(posts)}+ published")
+            print(f"   Drafts: {len(drafts)} pending")
+        else:
+            print("❌ Connection failed")
@@ -6,17 +6,22 @@ Model Context Protocol server for Substack integration.
 Provides tools for creating, editing, and publishing Substack posts.
 """
 
-import json
+import asyncio
 import os
 import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional
+from typing import Optional
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# When run as a script from a checkout, make the sibling substack_client module
+# importable; installed packages get it from site-packages (see pyproject.toml)
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from substack_client import SubstackClient, SubstackDocument, MarkdownToSubstack
+from substack_client import SubstackClient, SubstackDocument, MarkdownToSubstack, _dumps, _loads
 
 import mcp.types as types
 from mcp.server import Server
@@ -25,9 +30,60 @@ from mcp.server.stdio import stdio_server
 # Create server instance
 server = Server("substack")
 
+
+@dataclass
+class LiveSession:
+    """The active live blog; its serialized form is kept until the next update"""
+    draft_id: int
+    title: str
+    started_at: str
+    updates: int = 0
+    active: bool = True
+    _json: Optional[str] = field(default=None, repr=False, compare=False)
+
+    def bump(self) -> None:
+        self.updates += 1
+        self._json = None
+
+    def as_dict(self) -> dict:
+        return {"draft_id": self.draft_id, "title": self.title, "started_at": self.started_at,
+                "updates": self.updates, "active": self.active}
+
+    def to_json(self) -> str:
+        if self._json is None:
+            self._json = _dumps(self.as_dict())
+        return self._json
+
+
 # Global state
 client: Optional[SubstackClient] = None
-live_session: Optional[dict] = None
+live_session: Optional[LiveSession] = None
+
+# draft_id -> (monotonic time, body_json, top-level heading count) for bodies
+# this server last wrote.
+# Appends within the TTL skip the GET; after it, edits made elsewhere (e.g. in
+# the web editor) are picked up again.
+_body_cache: dict[int, tuple[float, dict, int]] = {}
+_BODY_CACHE_TTL = 30.0
+
+# Appends to the same draft are serialized per draft; appends queued while a
+# write is in flight are merged into the next single update_draft call. Ops
+# without a future were deferred (see _APPEND_FLUSH_DELAY) and have no waiter.
+_draft_locks: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+_pending_ops: defaultdict[int, list[tuple[list, Optional[asyncio.Future]]]] = defaultdict(list)
+
+# Opt-in debounce: with a delay > 0, append/code/image tools queue their nodes
+# and return at once; one write per draft is made after the delay. A failed
+# deferred write is logged and retried after another delay; update and publish
+# report the failure instead of proceeding without the queued content.
+_APPEND_FLUSH_DELAY = float(os.getenv("SUBSTACK_APPEND_FLUSH_DELAY") or 0)
+_flush_tasks: dict[int, asyncio.Task] = {}
+
+
+def _short_time_now() -> str:
+    """Local time as "%I:%M %p" (e.g. "09:05 PM"), without strftime or locale lookups"""
+    lt = time.localtime()
+    return f"{lt.tm_hour % 12 or 12:02d}:{lt.tm_min:02d} {'PM' if lt.tm_hour >= 12 else 'AM'}"
 
 
 def init_client():
@@ -39,16 +95,33 @@ def init_client():
     if token and publication:
         try:
             client = SubstackClient(token, publication)
-            if client.test_connection():
-                print(f"Connected to Substack: {publication}", file=sys.stderr)
-            else:
-                print("Substack connection test failed", file=sys.stderr)
-                client = None
         except Exception as e:
             print(f"Failed to initialize Substack client: {e}", file=sys.stderr)
             client = None
 
 
+async def _verify_client():
+    """
+    Check the client's credentials without holding up server startup.
+
+    The client is usable as soon as init_client() returns; if the check fails
+    it is dropped and tools report it as not initialized.
+    """
+    global client
+    checked = client
+    if checked is None:
+        return
+    try:
+        if await _run(checked.test_connection):
+            print(f"Connected to Substack: {checked.publication}", file=sys.stderr)
+            return
+        print("Substack connection test failed", file=sys.stderr)
+    except Exception as e:
+        print(f"Substack connection test failed: {e}", file=sys.stderr)
+    if client is checked:
+        client = None
+
+
 def _parse_draft_body(draft_data: dict) -> tuple[Optional[dict], Optional[str]]:
     # Substack returns current content in "body_json" (parsed) and may also
     # keep the raw submission in "draft_body".  Prefer body_json because the
@@ -60,8 +133,8 @@ def _parse_draft_body(draft_data: dict) -> tuple[Optional[dict], Optional[str]]:
         body_json = raw_body
     elif isinstance(raw_body, str):
         try:
-            body_json = json.loads(raw_body)
-        except Exception as exc:
+            body_json = _loads(raw_body)
+        except ValueError as exc:
             return None, f"Could not parse draft body JSON: {exc}"
     else:
         return None, f"Unsupported draft_body type: {type(raw_body).__name__}"
@@ -75,11 +148,15 @@ def _parse_draft_body(draft_data: dict) -> tuple[Optional[dict], Optional[str]]:
     return body_json, None
 
 
-@server.list_tools()
-async def list_tools() -> list[types.Tool]:
-    """List available tools"""
+def _build_tools() -> list[types.Tool]:
+    """
+    Tool schemas; static, so built once at import (see _TOOLS_CACHE).
+
+    model_construct skips pydantic validation; every field here is a plain
+    str or dict that we author, so there is nothing to coerce.
+    """
     return [
-        types.Tool(
+        types.Tool.model_construct(
             name="substack_create_draft",
             description="Create a new Substack draft post",
             inputSchema={
@@ -98,7 +175,7 @@ async def list_tools() -> list[types.Tool]:
                 "required": ["title"]
             }
         ),
-        types.Tool(
+        types.Tool.model_construct(
             name="substack_update_draft",
             description="Update an existing draft's content",
             inputSchema={
@@ -112,7 +189,7 @@ async def list_tools() -> list[types.Tool]:
                 "required": ["draft_id"]
             }
         ),
-        types.Tool(
+        types.Tool.model_construct(
             name="substack_append_to_draft",
             description="Append content to an existing draft (for live blogging)",
             inputSchema={
@@ -126,7 +203,7 @@ async def list_tools() -> list[types.Tool]:
                 "required": ["draft_id", "content"]
             }
         ),
-        types.Tool(
+        types.Tool.model_construct(
             name="substack_add_code_block",
             description="Add a code block to a draft",
             inputSchema={
@@ -141,7 +218,7 @@ async def list_tools() -> list[types.Tool]:
                 "required": ["draft_id", "code"]
             }
         ),
-        types.Tool(
+        types.Tool.model_construct(
             name="substack_add_image",
             description="Add an image to a draft",
             inputSchema={
@@ -155,7 +232,7 @@ async def list_tools() -> list[types.Tool]:
                 "required": ["draft_id", "url"]
             }
         ),
-        types.Tool(
+        types.Tool.model_construct(
             name="substack_publish",
             description="Publish a draft to your Substack",
             inputSchema={
@@ -167,7 +244,7 @@ async def list_tools() -> list[types.Tool]:
                 "required": ["draft_id"]
             }
         ),
-        types.Tool(
+        types.Tool.model_construct(
             name="substack_post_note",
             description="Post a short note (like a tweet)",
             inputSchema={
@@ -179,12 +256,12 @@ async def list_tools() -> list[types.Tool]:
                 "required": ["text"]
             }
         ),
-        types.Tool(
+        types.Tool.model_construct(
             name="substack_get_drafts",
             description="List all drafts",
             inputSchema={"type": "object", "properties": {}}
         ),
-        types.Tool(
+        types.Tool.model_construct(
             name="substack_get_posts",
             description="List published posts",
             inputSchema={
@@ -194,7 +271,7 @@ async def list_tools() -> list[types.Tool]:
                 }
             }
         ),
-        types.Tool(
+        types.Tool.model_construct(
             name="substack_live_blog_start",
             description="Start a live blogging session",
             inputSchema={
@@ -206,7 +283,7 @@ async def list_tools() -> list[types.Tool]:
                 "required": ["title"]
             }
         ),
-        types.Tool(
+        types.Tool.model_construct(
             name="substack_live_blog_end",
             description="End the current live blogging session",
             inputSchema={
@@ -219,231 +296,390 @@ async def list_tools() -> list[types.Tool]:
     ]
 
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
-    """Execute a tool call"""
-    global client, live_session
+# Shared by every tools/list response. The SDK wraps and serializes the list
+# itself on each request and offers no hook for a pre-serialized payload, so
+# reusing these objects is as far as the caching can go.
+_TOOLS_CACHE: list[types.Tool] = _build_tools()
 
-    if not client:
-        return [types.TextContent(type="text", text=json.dumps({"error": "Substack client not initialized. Set SUBSTACK_SID and SUBSTACK_PUBLICATION."}))]
 
-    try:
-        result = {}
-
-        if name == "substack_create_draft":
-            title = arguments.get("title", "Untitled")
-            subtitle = arguments.get("subtitle", "")
-            body = arguments.get("body", "")
-            audience = arguments.get("audience", "everyone")
-
-            draft = client.create_draft(
-                title=title,
-                subtitle=subtitle,
-                body=body,
-                audience=audience
-            )
-
-            result = {
-                "success": True,
-                "draft_id": draft.id,
-                "title": draft.title,
-                "edit_url": f"https://{client.publication}/publish/post/{draft.id}"
-            }
+async def _run(fn, *args, **kwargs):
+    """Run a blocking SubstackClient call in a worker thread, off the event loop"""
+    return await asyncio.to_thread(fn, *args, **kwargs)
 
-        elif name == "substack_update_draft":
-            draft_id = arguments.get("draft_id")
-            client.update_draft(
-                draft_id=draft_id,
-                title=arguments.get("title"),
-                subtitle=arguments.get("subtitle"),
-                body=arguments.get("body")
-            )
-            result = {"success": True, "draft_id": draft_id, "message": "Draft updated"}
-
-        elif name == "substack_append_to_draft":
-            draft_id = arguments.get("draft_id")
-            content = arguments.get("content", "")
-            section_title = arguments.get("section_title")
-            add_timestamp = arguments.get("add_timestamp", True)
-
-            draft_data = client.get_draft(draft_id)
-            body_json, error = _parse_draft_body(draft_data)
-            if error:
-                return [types.TextContent(type="text", text=json.dumps({"error": error}))]
-
-            new_content = []
-            if section_title:
-                timestamp = ""
-                if add_timestamp:
-                    timestamp = f" ({datetime.now().strftime('%I:%M %p')})"
-                new_content.append({
-                    "type": "heading",
-                    "attrs": {"level": 3},
-                    "content": [{"type": "text", "text": f"{section_title}{timestamp}"}]
-                })
-
-            converted = MarkdownToSubstack.convert(content)
-            new_content.extend(converted.get("content", []))
-            body_json["content"].extend(new_content)
-            client.update_draft(draft_id=draft_id, body=body_json)
-            if live_session and live_session.get("draft_id") == draft_id:
-                live_session["updates"] = live_session.get("updates", 0) + 1
-
-            result = {
-                "success": True,
-                "draft_id": draft_id,
-                "message": "Content appended",
-                "total_sections": len([n for n in body_json["content"] if n.get("type") == "heading"])
-            }
 
-        elif name == "substack_add_code_block":
-            draft_id = arguments.get("draft_id")
-            code = arguments.get("code", "")
-            language = arguments.get("language", "")
-            filename = arguments.get("filename", "")
-            caption = arguments.get("caption", "")
-
-            draft_data = client.get_draft(draft_id)
-            body_json, error = _parse_draft_body(draft_data)
-            if error:
-                return [types.TextContent(type="text", text=json.dumps({"error": error}))]
-
-            if filename:
-                body_json["content"].append({
-                    "type": "paragraph",
-                    "content": [{"type": "text", "text": f"📄 {filename}", "marks": [{"type": "code"}]}]
-                })
-
-            body_json["content"].append({
-                "type": "codeBlock",
-                "attrs": {"language": language},
-                "content": [{"type": "text", "text": code}]
-            })
-
-            if caption:
-                body_json["content"].append({
-                    "type": "paragraph",
-                    "content": [{"type": "text", "text": caption, "marks": [{"type": "em"}]}]
-                })
-
-            client.update_draft(draft_id=draft_id, body=body_json)
-            if live_session and live_session.get("draft_id") == draft_id:
-                live_session["updates"] = live_session.get("updates", 0) + 1
-            result = {"success": True, "message": "Code block added"}
-
-        elif name == "substack_add_image":
-            draft_id = arguments.get("draft_id")
-            url = arguments.get("url")
-            caption = arguments.get("caption", "")
-            alt = arguments.get("alt", "")
-
-            draft_data = client.get_draft(draft_id)
-            body_json, error = _parse_draft_body(draft_data)
-            if error:
-                return [types.TextContent(type="text", text=json.dumps({"error": error}))]
-
-            image_doc = SubstackDocument()
-            image_doc.image(url, alt=alt, caption=caption)
-            body_json["content"].extend(image_doc.build()["content"])
-
-            client.update_draft(draft_id=draft_id, body=body_json)
-            if live_session and live_session.get("draft_id") == draft_id:
-                live_session["updates"] = live_session.get("updates", 0) + 1
-            result = {"success": True, "message": "Image added"}
-
-        elif name == "substack_publish":
-            draft_id = arguments.get("draft_id")
-            send_email = arguments.get("send_email", False)
-            pub_result = client.publish_draft(draft_id, send_email=send_email)
-            result = {"success": True, "url": pub_result.get("canonical_url", ""), "email_sent": send_email}
-
-        elif name == "substack_post_note":
-            text = arguments.get("text", "")
-            link_url = arguments.get("link_url")
-            if link_url:
-                note_result = client.post_note_with_link(text, link_url)
-            else:
-                note_result = client.post_note(text)
-            result = {"success": True, "note_id": note_result.get("id"), "message": "Note posted"}
-
-        elif name == "substack_get_drafts":
-            drafts = client.get_drafts()
-            result = {"drafts": [{"id": d.id, "title": d.title or "(Untitled)", "subtitle": d.subtitle} for d in drafts]}
-
-        elif name == "substack_get_posts":
-            limit = arguments.get("limit", 10)
-            posts = client.get_archive(limit=limit)
-            result = {"posts": [{"id": p.id, "title": p.title, "url": p.canonical_url, "date": p.post_date} for p in posts]}
-
-        elif name == "substack_live_blog_start":
-            title = arguments.get("title", f"Live Blog - {datetime.now().strftime('%Y-%m-%d')}")
-            subtitle = arguments.get("subtitle", "")
-
-            doc = SubstackDocument()
-            doc.paragraph("🔴 ", doc.bold("Live Blog Started"), f" - {datetime.now().strftime('%I:%M %p')}")
-            doc.horizontal_rule()
-
-            draft = client.create_draft(title=title, subtitle=subtitle, body=doc)
-
-            live_session = {
-                "draft_id": draft.id,
-                "title": title,
-                "started_at": datetime.now().isoformat(),
-                "updates": 0,
-                "active": True
-            }
+def _count_headings(nodes: list) -> int:
+    return sum(1 for n in nodes if n.get("type") == "heading")
+
+
+async def _load_body(draft_id: int) -> tuple[Optional[dict], int, Optional[str]]:
+    """(body_json, heading count, error) from the cache when fresh, otherwise fetched"""
+    cached = _body_cache.get(draft_id)
+    if cached and time.monotonic() - cached[0] < _BODY_CACHE_TTL:
+        return cached[1], cached[2], None
+    _body_cache.pop(draft_id, None)
+    body_json, error = _parse_draft_body(await _run(client.get_draft, draft_id))
+    if error:
+        return None, 0, error
+    return body_json, _count_headings(body_json["content"]), None
 
-            result = {
-                "success": True,
-                "session": live_session,
-                "edit_url": f"https://{client.publication}/publish/post/{draft.id}"
-            }
 
-        elif name == "substack_live_blog_end":
-            if not live_session:
-                result = {"error": "No active live blog session"}
+async def _save_body(draft_id: int, body_json: dict, headings: int) -> None:
+    """Write the draft body and remember it; a failed write drops the cache entry"""
+    try:
+        await _run(client.update_draft, draft_id=draft_id, body=body_json)
+    except Exception:
+        _body_cache.pop(draft_id, None)
+        raise
+    _body_cache[draft_id] = (time.monotonic(), body_json, headings)
+
+
+async def _drain(draft_id: int) -> Optional[str]:
+    """
+    Write every queued append for a draft in one read-modify-write.
+
+    Returns the error if the write failed, else None. Failed deferred ops are
+    queued again with a new flush scheduled, so callers that must not proceed
+    without them (publish, update) check the result.
+    """
+    async with _draft_locks[draft_id]:
+        ops = _pending_ops.pop(draft_id, [])
+        if not ops:
+            return None
+        failure = None
+        headings, error = 0, None
+        try:
+            body_json, headings, error = await _load_body(draft_id)
+            if error is None:
+                for op_nodes, _ in ops:
+                    body_json["content"].extend(op_nodes)
+                    headings += _count_headings(op_nodes)
+                await _save_body(draft_id, body_json, headings)
+        except Exception as exc:
+            failure = exc
+
+        for _, op_future in ops:
+            if op_future is None:
+                continue
+            if failure is not None:
+                op_future.set_exception(failure)
             else:
-                draft_id = live_session["draft_id"]
-                publish = arguments.get("publish", False)
+                op_future.set_result((headings, error))
 
-                # Append closing
-                draft_data = client.get_draft(draft_id)
-                body_json, error = _parse_draft_body(draft_data)
-                if error:
-                    return [types.TextContent(type="text", text=json.dumps({"error": error}))]
+        if failure is None and not error:
+            return None
+        deferred = [op for op in ops if op[1] is None]
+        if deferred:
+            _pending_ops[draft_id][:0] = deferred
+            _schedule_flush(draft_id)
+            print(f"Deferred write to draft {draft_id} failed, will retry: {failure or error}",
+                  file=sys.stderr)
+        return str(failure or error)
 
-                closing_doc = SubstackDocument()
-                closing_doc.paragraph("🔴 ", closing_doc.bold("Live Blog Ended"), f" - {datetime.now().strftime('%I:%M %p')}")
-                body_json["content"].extend(closing_doc.build()["content"])
-                client.update_draft(draft_id=draft_id, body=body_json)
 
-                result = {"success": True, "session": live_session, "published": False}
+async def _append_nodes(draft_id: int, nodes: list) -> tuple[int, Optional[str]]:
+    """
+    Append nodes to a draft, returning (total heading count, error).
 
-                if publish:
-                    pub_result = client.publish_draft(draft_id, send_email=False)
-                    result["published"] = True
-                    result["url"] = pub_result.get("canonical_url")
+    The nodes are queued first; whoever next holds the draft's lock writes
+    every queued append in one read-modify-write and resolves their futures.
+    """
+    future = asyncio.get_running_loop().create_future()
+    _pending_ops[draft_id].append((nodes, future))
+    await _drain(draft_id)
+    return await future
 
-                live_session = None
 
-        else:
-            result = {"error": f"Unknown tool: {name}"}
+async def _flush_after(draft_id: int) -> None:
+    try:
+        await asyncio.sleep(_APPEND_FLUSH_DELAY)
+    finally:
+        _flush_tasks.pop(draft_id, None)
+    await _drain(draft_id)
+
 
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+def _schedule_flush(draft_id: int) -> None:
+    """Start a debounced write for the draft unless one is already waiting"""
+    task = _flush_tasks.get(draft_id)
+    if task is None or task.done():
+        _flush_tasks[draft_id] = asyncio.get_running_loop().create_task(_flush_after(draft_id))
+
+
+def _defer_nodes(draft_id: int, nodes: list) -> None:
+    """Queue nodes for the draft's next debounced write (_APPEND_FLUSH_DELAY > 0)"""
+    _pending_ops[draft_id].append((nodes, None))
+    _schedule_flush(draft_id)
+
+
+async def _drain_or_fail(draft_id: int) -> None:
+    """Write queued appends before an operation that must see them"""
+    error = await _drain(draft_id)
+    if error:
+        raise _ToolError(f"Queued content for draft {draft_id} could not be written: {error}")
+
+
+@server.list_tools()
+async def list_tools() -> list[types.Tool]:
+    """List available tools"""
+    return _TOOLS_CACHE
+
+
+class _ToolError(Exception):
+    """Tool failure reported to the caller as {"error": message}"""
+
+
+def _count_live_update(draft_id: int) -> None:
+    """Bump the live session's update counter if the draft belongs to it"""
+    if live_session and live_session.draft_id == draft_id:
+        live_session.bump()
+
+
+async def _h_create_draft(arguments: dict) -> dict:
+    title = arguments.get("title", "Untitled")
+    subtitle = arguments.get("subtitle", "")
+    body = arguments.get("body", "")
+    audience = arguments.get("audience", "everyone")
+
+    draft = await _run(
+        client.create_draft,
+        title=title,
+        subtitle=subtitle,
+        body=body,
+        audience=audience
+    )
+
+    return {
+        "success": True,
+        "draft_id": draft.id,
+        "title": draft.title,
+        "edit_url": client.edit_base + str(draft.id)
+    }
+
+
+async def _h_update_draft(arguments: dict) -> dict:
+    draft_id = arguments.get("draft_id")
+    # Write queued appends first, then take the draft's lock so an in-flight
+    # append cannot overwrite the new body
+    await _drain_or_fail(draft_id)
+    async with _draft_locks[draft_id]:
+        _body_cache.pop(draft_id, None)
+        await _run(
+            client.update_draft,
+            draft_id=draft_id,
+            title=arguments.get("title"),
+            subtitle=arguments.get("subtitle"),
+            body=arguments.get("body")
+        )
+    return {"success": True, "draft_id": draft_id, "message": "Draft updated"}
+
+
+async def _h_append_to_draft(arguments: dict) -> dict:
+    draft_id = arguments.get("draft_id")
+    content = arguments.get("content", "")
+    section_title = arguments.get("section_title")
+    add_timestamp = arguments.get("add_timestamp", True)
+
+    doc = SubstackDocument()
+    if section_title:
+        timestamp = ""
+        if add_timestamp:
+            timestamp = f" ({_short_time_now()})"
+        doc.heading(f"{section_title}{timestamp}", level=3)
+
+    new_content = doc.content
+    converted = MarkdownToSubstack.convert(content)
+    new_content.extend(converted.get("content", []))
+    if _APPEND_FLUSH_DELAY > 0:
+        _defer_nodes(draft_id, new_content)
+        _count_live_update(draft_id)
+        return {"success": True, "draft_id": draft_id, "message": "Content queued", "pending": True}
+    headings, error = await _append_nodes(draft_id, new_content)
+    if error:
+        raise _ToolError(error)
+    _count_live_update(draft_id)
+
+    return {
+        "success": True,
+        "draft_id": draft_id,
+        "message": "Content appended",
+        "total_sections": headings
+    }
+
+
+async def _h_add_code_block(arguments: dict) -> dict:
+    draft_id = arguments.get("draft_id")
+    code = arguments.get("code", "")
+    language = arguments.get("language", "")
+    filename = arguments.get("filename", "")
+    caption = arguments.get("caption", "")
+
+    doc = SubstackDocument()
+    if filename:
+        doc.paragraph(doc.code(f"📄 {filename}"))
+    doc.code_block(code, language)
+    if caption:
+        doc.paragraph(doc.italic(caption))
+    new_content = doc.content
+
+    if _APPEND_FLUSH_DELAY > 0:
+        _defer_nodes(draft_id, new_content)
+        _count_live_update(draft_id)
+        return {"success": True, "message": "Code block queued", "pending": True}
+    _, error = await _append_nodes(draft_id, new_content)
+    if error:
+        raise _ToolError(error)
+    _count_live_update(draft_id)
+    return {"success": True, "message": "Code block added"}
+
+
+async def _h_add_image(arguments: dict) -> dict:
+    draft_id = arguments.get("draft_id")
+    url = arguments.get("url")
+    caption = arguments.get("caption", "")
+    alt = arguments.get("alt", "")
+
+    image_doc = SubstackDocument()
+    image_doc.image(url, alt=alt, caption=caption)
+    if _APPEND_FLUSH_DELAY > 0:
+        _defer_nodes(draft_id, image_doc.content)
+        _count_live_update(draft_id)
+        return {"success": True, "message": "Image queued", "pending": True}
+    _, error = await _append_nodes(draft_id, image_doc.content)
+    if error:
+        raise _ToolError(error)
+    _count_live_update(draft_id)
+    return {"success": True, "message": "Image added"}
+
+
+async def _h_publish(arguments: dict) -> dict:
+    draft_id = arguments.get("draft_id")
+    send_email = arguments.get("send_email", False)
+    await _drain_or_fail(draft_id)
+    pub_result = await _run(client.publish_draft, draft_id, send_email=send_email)
+    _body_cache.pop(draft_id, None)
+    return {"success": True, "url": pub_result.get("canonical_url", ""), "email_sent": send_email}
+
+
+async def _h_post_note(arguments: dict) -> dict:
+    text = arguments.get("text", "")
+    link_url = arguments.get("link_url")
+    if link_url:
+        note_result = await _run(client.post_note_with_link, text, link_url)
+    else:
+        note_result = await _run(client.post_note, text)
+    return {"success": True, "note_id": note_result.get("id"), "message": "Note posted"}
+
+
+async def _h_get_drafts(arguments: dict) -> dict:
+    drafts = await _run(client.get_drafts)
+    return {"drafts": [{"id": d.id, "title": d.title or "(Untitled)", "subtitle": d.subtitle} for d in drafts]}
+
+
+async def _h_get_posts(arguments: dict) -> dict:
+    limit = arguments.get("limit", 10)
+    posts = await _run(client.get_archive, limit=limit)
+    return {"posts": [{"id": p.id, "title": p.title, "url": p.canonical_url, "date": p.post_date} for p in posts]}
+
+
+async def _h_live_blog_start(arguments: dict) -> dict:
+    global live_session
+
+    title = arguments.get("title", f"Live Blog - {datetime.now().strftime('%Y-%m-%d')}")
+    subtitle = arguments.get("subtitle", "")
+
+    doc = SubstackDocument()
+    doc.paragraph("🔴 ", doc.bold("Live Blog Started"), f" - {_short_time_now()}")
+    doc.horizontal_rule()
+
+    draft = await _run(client.create_draft, title=title, subtitle=subtitle, body=doc)
+    _body_cache[draft.id] = (time.monotonic(), draft.body_json,
+                             _count_headings(draft.body_json["content"]))
+
+    live_session = LiveSession(draft.id, title, datetime.now().isoformat())
+
+    return {
+        "success": True,
+        "session": live_session.as_dict(),
+        "edit_url": client.edit_base + str(draft.id)
+    }
+
+
+async def _h_live_blog_end(arguments: dict) -> dict:
+    global live_session
+
+    if not live_session:
+        return {"error": "No active live blog session"}
+
+    draft_id = live_session.draft_id
+    publish = arguments.get("publish", False)
+
+    # Append closing
+    closing_doc = SubstackDocument()
+    closing_doc.paragraph("🔴 ", closing_doc.bold("Live Blog Ended"), f" - {_short_time_now()}")
+    try:
+        _, error = await _append_nodes(draft_id, closing_doc.build()["content"])
+    finally:
+        _body_cache.pop(draft_id, None)
+    if error:
+        raise _ToolError(error)
+
+    result = {"success": True, "session": live_session.as_dict(), "published": False}
+
+    if publish:
+        pub_result = await _run(client.publish_draft, draft_id, send_email=False)
+        result["published"] = True
+        result["url"] = pub_result.get("canonical_url")
+
+    live_session = None
+    return result
+
+
+_HANDLERS = {
+    "substack_create_draft": _h_create_draft,
+    "substack_update_draft": _h_update_draft,
+    "substack_append_to_draft": _h_append_to_draft,
+    "substack_add_code_block": _h_add_code_block,
+    "substack_add_image": _h_add_image,
+    "substack_publish": _h_publish,
+    "substack_post_note": _h_post_note,
+    "substack_get_drafts": _h_get_drafts,
+    "substack_get_posts": _h_get_posts,
+    "substack_live_blog_start": _h_live_blog_start,
+    "substack_live_blog_end": _h_live_blog_end,
+}
+
+
+@server.call_tool()
+async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
+    """Execute a tool call"""
+    if not client:
+        return [types.TextContent(type="text", text=_dumps({"error": "Substack client not initialized. Set SUBSTACK_SID and SUBSTACK_PUBLICATION."}))]
+
+    handler = _HANDLERS.get(name)
+    try:
+        if handler is None:
+            result = {"error": f"Unknown tool: {name}"}
+        else:
+            result = await handler(arguments)
+        return [types.TextContent(type="text", text=_dumps(result))]
 
     except Exception as e:
-        return [types.TextContent(type="text", text=json.dumps({"error": str(e)}))]
+        return [types.TextContent(type="text", text=_dumps({"error": str(e)}))]
+
+
+# Validated once rather than per resources/list call. Unlike the tools these
+# cannot use model_construct: uri must be coerced to AnyUrl to serialize cleanly.
+_RESOURCES: list[types.Resource] = [
+    types.Resource(uri="substack://drafts", name="Substack Drafts", description="List of all draft posts", mimeType="application/json"),
+    types.Resource(uri="substack://posts", name="Substack Posts", description="List of published posts", mimeType="application/json"),
+    types.Resource(uri="substack://profile", name="Substack Profile", description="Your Substack profile", mimeType="application/json"),
+    types.Resource(uri="substack://live-session", name="Live Blog Session", description="Current live blogging session state", mimeType="application/json")
+]
 
 
 @server.list_resources()
 async def list_resources() -> list[types.Resource]:
     """List available resources"""
-    return [
-        types.Resource(uri="substack://drafts", name="Substack Drafts", description="List of all draft posts", mimeType="application/json"),
-        types.Resource(uri="substack://posts", name="Substack Posts", description="List of published posts", mimeType="application/json"),
-        types.Resource(uri="substack://profile", name="Substack Profile", description="Your Substack profile", mimeType="application/json"),
-        types.Resource(uri="substack://live-session", name="Live Blog Session", description="Current live blogging session state", mimeType="application/json")
-    ]
+    return _RESOURCES
 
 
 @server.read_resource()
@@ -452,31 +688,40 @@ async def read_resource(uri: str) -> str:
     global client, live_session
 
     if not client:
-        return json.dumps({"error": "Client not initialized"})
+        return _dumps({"error": "Client not initialized"})
 
     if uri == "substack://drafts":
-        drafts = client.get_drafts()
-        return json.dumps([{"id": d.id, "title": d.title, "subtitle": d.subtitle} for d in drafts], indent=2)
+        drafts = await _run(client.get_drafts)
+        return _dumps([{"id": d.id, "title": d.title, "subtitle": d.subtitle} for d in drafts])
 
     elif uri == "substack://posts":
-        posts = client.get_archive(limit=20)
-        return json.dumps([{"id": p.id, "title": p.title, "url": p.canonical_url} for p in posts], indent=2)
+        posts = await _run(client.get_archive, limit=20)
+        return _dumps([{"id": p.id, "title": p.title, "url": p.canonical_url} for p in posts])
 
     elif uri == "substack://profile":
-        profile = client.get_profile()
-        return json.dumps({"id": profile.id, "name": profile.name, "handle": profile.handle, "url": profile.url}, indent=2)
+        profile = await _run(client.get_profile)
+        return _dumps({"id": profile.id, "name": profile.name, "handle": profile.handle, "url": profile.url})
 
     elif uri == "substack://live-session":
-        return json.dumps(live_session or {"active": False}, indent=2)
+        return live_session.to_json() if live_session else _dumps({"active": False})
 
-    return json.dumps({"error": f"Unknown resource: {uri}"})
+    return _dumps({"error": f"Unknown resource: {uri}"})
 
 
 async def _main():
     """Async entry point"""
     init_client()
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    verify = asyncio.create_task(_verify_client())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+    finally:
+        verify.cancel()
+        # Write any debounced appends, then release pooled connections
+        for draft_id in list(_pending_ops):
+            await _drain(draft_id)
+        if client:
+            client.close()
 
 
 def main():
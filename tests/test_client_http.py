@@ -0,0 +1,264 @@
+import json
+import time
+import unittest
+from unittest import mock
+
+import requests
+
+import substack_client
+from substack_client import SubstackClient, _TokenBucket
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, content=b"{}", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class FakeSession:
+    """Replays queued responses and records each request"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def _respond(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.responses.pop(0)
+
+    def get(self, url, **kwargs):
+        return self._respond("GET", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self._respond("PUT", url, **kwargs)
+
+    def close(self):
+        pass
+
+
+def make_client(*responses):
+    client = SubstackClient("token", "pub.example.com", rate_limit=0)
+    client._session = FakeSession(*responses)
+    return client
+
+
+class ArchiveClient(SubstackClient):
+    """Serves a fixed archive listing and posts by id instead of making requests"""
+
+    def __init__(self, archive=(), posts=None):
+        super().__init__("token", "pub.example.com", rate_limit=0)
+        self.archive = list(archive)
+        self.posts = posts or {}
+
+    def _get(self, base, path):
+        if path.startswith("/archive"):
+            return self.archive
+        return {"post": self.posts[int(path.rsplit("/", 1)[-1])]}
+
+
+class TestConditionalGet(unittest.TestCase):
+    def test_not_modified_returns_cached_body(self):
+        client = make_client(
+            FakeResponse(200, b'{"name": "Pub"}', {"ETag": '"v1"'}),
+            FakeResponse(304, b""),
+        )
+        first = client.get_publication()
+        first["name"] = "mutated by caller"
+        second = client.get_publication()
+
+        self.assertEqual(second, {"name": "Pub"})
+        _, _, kwargs = client._session.calls[1]
+        self.assertEqual(kwargs["headers"]["If-None-Match"], '"v1"')
+
+    def test_no_etag_sends_unconditional_request(self):
+        client = make_client(
+            FakeResponse(200, b'{"a": 1}'),
+            FakeResponse(200, b'{"a": 2}'),
+        )
+        client.get_publication()
+        self.assertEqual(client.get_publication(), {"a": 2})
+        _, _, kwargs = client._session.calls[1]
+        self.assertNotIn("If-None-Match", kwargs.get("headers") or {})
+
+    def test_cache_evicts_least_recently_used(self):
+        client = make_client(*[
+            FakeResponse(200, b"{}", {"ETag": f'"{i}"'}) for i in range(3)
+        ])
+        with mock.patch.object(substack_client, "_ETAG_CACHE_SIZE", 2):
+            client._get(client.pub_base, "/a")
+            client._get(client.pub_base, "/b")
+            client._get(client.pub_base, "/c")
+        self.assertEqual([url.rsplit("/", 1)[-1] for url in client._etag_cache], ["b", "c"])
+
+
+class TestThrottling(unittest.TestCase):
+    def test_retries_after_429(self):
+        client = make_client(
+            FakeResponse(429, b"", {"Retry-After": "0"}),
+            FakeResponse(200, b'{"name": "Pub"}'),
+        )
+        self.assertEqual(client.get_publication(), {"name": "Pub"})
+        self.assertEqual(len(client._session.calls), 2)
+
+    def test_bad_retry_after_does_not_raise(self):
+        for value, expected in (("-5", 0.0), ("nan", 1), ("inf", 1)):
+            with self.subTest(value=value):
+                client = make_client(
+                    FakeResponse(429, b"", {"Retry-After": value}),
+                    FakeResponse(200, b'{"name": "Pub"}'),
+                )
+                with mock.patch.object(substack_client.time, "sleep") as sleep:
+                    self.assertEqual(client.get_publication(), {"name": "Pub"})
+                sleep.assert_called_once_with(expected)
+
+    def test_bucket_allows_burst_then_slows_down(self):
+        bucket = _TokenBucket(rate=1000, capacity=3)
+        start = time.monotonic()
+        for _ in range(3):
+            bucket.take()
+        self.assertLess(time.monotonic() - start, 0.05)
+
+        bucket.slow_down()
+        self.assertEqual(bucket.rate, 500)
+        bucket.speed_up()
+        self.assertEqual(bucket.rate, 600)
+        for _ in range(10):
+            bucket.speed_up()
+        self.assertEqual(bucket.rate, 1000)
+
+
+class TestArchiveColumnar(unittest.TestCase):
+    ARCHIVE = [
+        {"id": 1, "title": "One", "wordcount": 100, "body_html": "<p>1</p>"},
+        {"id": 2, "title": "Two", "wordcount": None, "comment_count": 3},
+    ]
+
+    def test_columns_are_index_aligned(self):
+        cols = ArchiveClient(self.ARCHIVE).get_archive_columnar()
+        self.assertEqual(list(cols["id"]), [1, 2])
+        self.assertEqual(sum(cols["wordcount"]), 100)
+        self.assertEqual(list(cols["comment_count"]), [0, 3])
+        self.assertEqual(cols["title"], ["One", "Two"])
+        self.assertEqual(cols["audience"], ["everyone", "everyone"])
+        self.assertNotIn("body_html", cols)
+
+    def test_bodies_are_opt_in(self):
+        cols = ArchiveClient(self.ARCHIVE).get_archive_columnar(include_bodies=True)
+        self.assertEqual(cols["body_html"], ["<p>1</p>", ""])
+        self.assertEqual(cols["body_json"], [{}, {}])
+
+    def test_missing_id_raises(self):
+        with self.assertRaises(KeyError):
+            ArchiveClient([{"title": "No id"}]).get_archive_columnar()
+
+
+class TestConnection(unittest.TestCase):
+    def test_success_caches_user_id(self):
+        client = make_client(FakeResponse(200, b'{"user_id": 42}'))
+        self.assertTrue(client.test_connection())
+        self.assertEqual(client.get_user_id(), 42)
+        self.assertEqual(len(client._session.calls), 1)
+
+    def test_http_error_reports_failure(self):
+        client = make_client(FakeResponse(401, b'{"error": "Not authorized"}'))
+        self.assertFalse(client.test_connection())
+
+
+class TestInjectedSession(unittest.TestCase):
+    def test_uses_and_does_not_close_external_session(self):
+        session = requests.Session()
+        session.close = mock.Mock()
+        with SubstackClient("token", "pub.example.com", session=session) as client:
+            self.assertIs(client._session, session)
+            self.assertNotIn("Cookie", session.headers)
+        session.close.assert_not_called()
+
+    def test_shared_session_sends_each_clients_cookie(self):
+        session = FakeSession(FakeResponse(200, b"{}"), FakeResponse(200, b"{}"))
+        session.headers = {"User-Agent": "caller"}
+        first = SubstackClient("tokA", "a.example.com", rate_limit=0, session=session)
+        second = SubstackClient("tokB", "b.example.com", rate_limit=0, session=session)
+        first.get_publication()
+        second.get_publication()
+        cookies = [kwargs["headers"]["Cookie"] for _, _, kwargs in session.calls]
+        self.assertEqual(cookies, ["substack.sid=tokA", "substack.sid=tokB"])
+        self.assertEqual(session.headers, {"User-Agent": "caller"})
+
+
+class TestClientCache(unittest.TestCase):
+    def test_reuses_client_per_token_and_publication(self):
+        self.addCleanup(substack_client._close_cached_clients)
+        first = substack_client._cached_client("token", "pub.example.com")
+        self.assertIs(substack_client._cached_client("token", "pub.example.com"), first)
+        self.assertIsNot(substack_client._cached_client("other", "pub.example.com"), first)
+
+
+class TestRequestBodies(unittest.TestCase):
+    def test_put_sends_serialized_bytes(self):
+        client = make_client(FakeResponse(200, b'{"id": 3}'))
+        body = {"type": "doc", "content": [{"type": "text", "text": "caf\u00e9"}]}
+        result = client.update_draft(3, body=body)
+
+        self.assertEqual(result, {"id": 3})
+        method, url, kwargs = client._session.calls[0]
+        self.assertEqual((method, url), ("PUT", "https://pub.example.com/api/v1/drafts/3"))
+        self.assertIsInstance(kwargs["data"], bytes)
+        sent = json.loads(kwargs["data"])
+        self.assertEqual(json.loads(sent["draft_body"]), body)
+
+
+class TestUploadImages(unittest.TestCase):
+    def test_results_keep_input_order(self):
+        class UploadClient(SubstackClient):
+            def upload_image(self, image_path):
+                self._rate_limit_wait()
+                return {"url": f"https://cdn.example.com/{image_path}"}
+
+        client = UploadClient("token", "pub.example.com", rate_limit=0)
+        paths = [f"img{i}.png" for i in range(10)]
+        results = client.upload_images(paths)
+        self.assertEqual([r["url"] for r in results],
+                         [f"https://cdn.example.com/{p}" for p in paths])
+
+    def test_upload_body_matches_data_uri_json(self):
+        import base64
+        import os
+        import tempfile
+
+        data = bytes(range(256)) * 5
+        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
+            f.write(data)
+        self.addCleanup(os.unlink, f.name)
+
+        body = SubstackClient._image_upload_body(f.name, "image/png", chunk_size=96)
+        expected = "data:image/png;base64," + base64.b64encode(data).decode()
+        self.assertEqual(json.loads(body), {"image": expected})
+
+
+class TestGetPosts(unittest.TestCase):
+    def test_fetches_each_id_in_order(self):
+        client = ArchiveClient(posts={i: {"id": i, "title": f"Post {i}"} for i in (5, 3, 9)})
+        posts = client.get_posts([5, 3, 9])
+        self.assertEqual([(p.id, p.title) for p in posts],
+                         [(5, "Post 5"), (3, "Post 3"), (9, "Post 9")])
+
+    def test_archive_full_fetches_each_archived_post(self):
+        client = ArchiveClient(
+            [{"id": 2, "title": "Two"}, {"id": 1, "title": "One"}],
+            {i: {"id": i, "body_html": f"<p>{i}</p>"} for i in (1, 2)},
+        )
+        posts = client.get_archive_full(limit=2)
+        self.assertEqual([(p.id, p.body_html) for p in posts],
+                         [(2, "<p>2</p>"), (1, "<p>1</p>")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,28 @@
 import json
+import os
+import sys
 import unittest
 import urllib.parse
+from unittest import mock
 
+_SERVER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "substack_mcp")
+if _SERVER_DIR not in sys.path:
+    sys.path.insert(0, _SERVER_DIR)
+
+try:
+    from server import _parse_draft_body
+except ModuleNotFoundError as e:  # server needs the mcp SDK; the client tests do not
+    if e.name != "mcp":
+        raise
+    _parse_draft_body = None
+
+import substack_client
 from substack_client import SubstackClient, SubstackDocument
 
+# Percent-encoded image URLs expected in internalRedirect
+_ENCODED_AB = urllib.parse.quote("https://example.com/a b.png", safe="")
+_ENCODED_SPACE = urllib.parse.quote("https://example.com/with space.png", safe="")
+
 
 class CaptureClient(SubstackClient):
     def __init__(self, *args, **kwargs):
@@ -11,11 +30,39 @@ class CaptureClient(SubstackClient):
         self.last_put = None
 
     def _put(self, base: str, path: str, data: dict) -> dict:
-        self.last_put = {"base": base, "path": path, "data": data}
+        self.last_put = (base, path, data)
+        return data
+
+
+class RecordingClient(SubstackClient):
+    """Records draft POST/PUT calls; the user-setting lookup is answered locally"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._user_id = 1
+        self.calls = []
+
+    def _post(self, base: str, path: str, data: dict) -> dict:
+        self.calls.append(("POST", path, data))
+        return {"id": 7}
+
+    def _put(self, base: str, path: str, data: dict) -> dict:
+        self.calls.append(("PUT", path, data))
         return data
 
 
 class TestImageHandling(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.client = CaptureClient("token", "pub.example.com")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.close()
+
+    def setUp(self):
+        self.client.last_put = None
+
     def test_document_image_caption_adds_paragraph(self):
         doc = SubstackDocument().image(
             "https://example.com/image.png",
@@ -29,7 +76,6 @@ class TestImageHandling(unittest.TestCase):
         self.assertTrue(any(mark.get("type") == "em" for mark in marks))
 
     def test_fix_internal_redirects_sets_url(self):
-        client = SubstackClient("token", "pub.example.com")
         body_json = {
             "type": "doc",
             "content": [{
@@ -40,85 +86,92 @@ class TestImageHandling(unittest.TestCase):
                 }]
             }]
         }
-        client._fix_internal_redirects(body_json["content"], 123)
+        self.client._fix_internal_redirects(body_json["content"], 123)
         attrs = body_json["content"][0]["content"][0]["attrs"]
-        encoded = urllib.parse.quote("https://example.com/a b.png", safe="")
-        expected = f"https://pub.example.com/i/123?img={encoded}"
+        expected = f"https://pub.example.com/i/123?img={_ENCODED_AB}"
         self.assertEqual(attrs.get("internalRedirect"), expected)
 
     def test_update_draft_applies_internal_redirects(self):
-        client = CaptureClient("token", "pub.example.com")
         doc = SubstackDocument().image("https://example.com/with space.png")
-        client.update_draft(42, body=doc)
-        self.assertIsNotNone(client.last_put)
-        draft_body = json.loads(client.last_put["data"]["draft_body"])
+        self.client.update_draft(42, body=doc)
+        self.assertIsNotNone(self.client.last_put)
+        draft_body = json.loads(self.client.last_put[2]["draft_body"])
         image_attrs = draft_body["content"][0]["content"][0]["attrs"]
-        encoded = urllib.parse.quote("https://example.com/with space.png", safe="")
-        expected = f"https://pub.example.com/i/42?img={encoded}"
+        expected = f"https://pub.example.com/i/42?img={_ENCODED_SPACE}"
         self.assertEqual(image_attrs.get("internalRedirect"), expected)
 
-
+    def test_update_draft_body_matches_stdlib_json(self):
+        doc = SubstackDocument().paragraph("Caf\u00e9 \u2014 \"quoted\"").image("https://example.com/x.png")
+        self.client.update_draft(42, body=doc)
+        fast = self.client.last_put[2]["draft_body"]
+        with mock.patch.object(substack_client, "orjson", None):
+            self.client.update_draft(42, body=doc)
+        self.assertEqual(json.loads(fast), json.loads(self.client.last_put[2]["draft_body"]))
+
+    def test_create_draft_without_images_uses_single_request(self):
+        client = RecordingClient("token", "pub.example.com")
+        doc = SubstackDocument().paragraph("Just text")
+        draft = client.create_draft("Title", body=doc)
+        self.assertEqual(draft.id, 7)
+        self.assertEqual([c[0] for c in client.calls], ["POST"])
+        self.assertEqual(json.loads(client.calls[0][2]["draft_body"]), doc.build())
+
+    def test_create_draft_with_images_fills_redirects_after_post(self):
+        client = RecordingClient("token", "pub.example.com")
+        doc = SubstackDocument().image("https://example.com/x.png")
+        client.create_draft("Title", body=doc)
+        self.assertEqual([c[0] for c in client.calls], ["POST", "PUT"])
+        body = json.loads(client.calls[1][2]["draft_body"])
+        redirect = body["content"][0]["content"][0]["attrs"]["internalRedirect"]
+        self.assertTrue(redirect.startswith("https://pub.example.com/i/7?img="))
+
+
+def _doc(*texts):
+    return {"type": "doc", "content": [
+        {"type": "paragraph", "content": [{"type": "text", "text": text}]} for text in texts]}
+
+
+# draft_body arrives as a JSON string; both forms are built once for every case
+_DRAFT_BODY = _doc("From draft_body")
+_DRAFT_BODY_STR = json.dumps(_DRAFT_BODY)
+
+# (case, draft data as returned by the API, expected parsed body, expected
+# error prefix or None)
+_PARSE_CASES = (
+    # body_json should be preferred when both fields exist
+    ("prefers_body_json",
+     {"body_json": _doc("From body_json"), "draft_body": _DRAFT_BODY_STR},
+     _doc("From body_json"), None),
+    # Should fall back to draft_body if body_json is missing/null
+    ("falls_back_to_draft_body",
+     {"body_json": None, "draft_body": _DRAFT_BODY_STR},
+     _DRAFT_BODY, None),
+    # Should return empty doc when both body_json and draft_body are missing
+    ("empty_when_both_missing", {}, {"type": "doc", "content": []}, None),
+    # body_json is typically already parsed as a dict by the API
+    ("body_json_dict",
+     {"body_json": _doc("Existing paragraph 1", "Existing paragraph 2"), "draft_body": None},
+     _doc("Existing paragraph 1", "Existing paragraph 2"), None),
+    # Unparseable draft_body is reported rather than raised
+    ("invalid_draft_body",
+     {"body_json": None, "draft_body": "{not json"},
+     None, "Could not parse draft body JSON"),
+)
+
+
+@unittest.skipUnless(_parse_draft_body, "server module not importable")
 class TestServerParseDraftBody(unittest.TestCase):
     """Test the server's _parse_draft_body function for API response handling"""
 
-    def test_prefers_body_json_over_draft_body(self):
-        """body_json should be preferred when both fields exist"""
-        # Import the server's parser
-        import sys
-        sys.path.insert(0, "substack_mcp")
-        from server import _parse_draft_body
-
-        draft_data = {
-            "body_json": {"type": "doc", "content": [{"type": "paragraph", "content": [{"type": "text", "text": "From body_json"}]}]},
-            "draft_body": '{"type": "doc", "content": [{"type": "paragraph", "content": [{"type": "text", "text": "From draft_body"}]}]}'
-        }
-        result, error = _parse_draft_body(draft_data)
-        self.assertIsNone(error)
-        self.assertEqual(result["content"][0]["content"][0]["text"], "From body_json")
-
-    def test_falls_back_to_draft_body_when_body_json_missing(self):
-        """Should fall back to draft_body if body_json is missing/null"""
-        import sys
-        sys.path.insert(0, "substack_mcp")
-        from server import _parse_draft_body
-
-        draft_data = {
-            "body_json": None,
-            "draft_body": '{"type": "doc", "content": [{"type": "paragraph", "content": [{"type": "text", "text": "From draft_body"}]}]}'
-        }
-        result, error = _parse_draft_body(draft_data)
-        self.assertIsNone(error)
-        self.assertEqual(result["content"][0]["content"][0]["text"], "From draft_body")
-
-    def test_returns_empty_doc_when_both_missing(self):
-        """Should return empty doc when both body_json and draft_body are missing"""
-        import sys
-        sys.path.insert(0, "substack_mcp")
-        from server import _parse_draft_body
-
-        draft_data = {}
-        result, error = _parse_draft_body(draft_data)
-        self.assertIsNone(error)
-        self.assertEqual(result, {"type": "doc", "content": []})
-
-    def test_handles_body_json_as_dict_directly(self):
-        """body_json is typically already parsed as a dict by the API"""
-        import sys
-        sys.path.insert(0, "substack_mcp")
-        from server import _parse_draft_body
-
-        existing_content = [
-            {"type": "paragraph", "content": [{"type": "text", "text": "Existing paragraph 1"}]},
-            {"type": "paragraph", "content": [{"type": "text", "text": "Existing paragraph 2"}]}
-        ]
-        draft_data = {
-            "body_json": {"type": "doc", "content": existing_content},
-            "draft_body": None
-        }
-        result, error = _parse_draft_body(draft_data)
-        self.assertIsNone(error)
-        self.assertEqual(len(result["content"]), 2)
-        self.assertEqual(result["content"][0]["content"][0]["text"], "Existing paragraph 1")
+    def test_parse_draft_body(self):
+        for case, draft_data, expected, error_prefix in _PARSE_CASES:
+            with self.subTest(case=case):
+                result, error = _parse_draft_body(draft_data)
+                self.assertEqual(result, expected)
+                if error_prefix is None:
+                    self.assertIsNone(error)
+                else:
+                    self.assertTrue(error.startswith(error_prefix))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,111 @@
+import json
+import time
+import unittest
+
+from substack_client import LiveBlogSession, SubstackDraft
+
+
+class FakeClient:
+    """Stands in for SubstackClient, keeping one draft in memory"""
+
+    def __init__(self):
+        self.body = None
+        self.gets = 0
+        self.puts = 0
+        self.fail_next_put = False
+
+    def create_draft(self, title, subtitle="", body=None):
+        self.body = json.loads(json.dumps(body.build()))
+        return SubstackDraft(id=1, title=title, body_json=body.build())
+
+    def get_draft(self, draft_id):
+        self.gets += 1
+        return {"id": draft_id, "body_json": json.loads(json.dumps(self.body))}
+
+    def update_draft(self, draft_id, body=None):
+        if self.fail_next_put:
+            self.fail_next_put = False
+            raise RuntimeError("HTTP 500")
+        self.puts += 1
+        self.body = json.loads(json.dumps(body))
+        return {}
+
+
+def texts(body):
+    return [node["content"][0]["text"] for node in body["content"]
+            if node["type"] == "paragraph" and node.get("content")]
+
+
+class TestLiveBlogSession(unittest.TestCase):
+    def test_updates_reuse_cached_body(self):
+        client = FakeClient()
+        session = LiveBlogSession(client)
+        session.start("Live")
+        session.add_update("one")
+        session.add_update("two")
+
+        self.assertEqual(client.gets, 0)
+        self.assertEqual(client.puts, 2)
+        self.assertEqual(texts(client.body)[-1], "two")
+
+    def test_flush_interval_batches_updates(self):
+        client = FakeClient()
+        session = LiveBlogSession(client, flush_interval=60)
+        session.start("Live")
+        session.add_update("one")
+        session.add_update("two")
+        self.assertEqual(client.puts, 0)
+
+        session.flush()
+        self.assertEqual(client.puts, 1)
+        self.assertIn("one", texts(client.body))
+        self.assertIn("two", texts(client.body))
+
+        result = session.end()
+        self.assertEqual(result["update_count"], 3)
+        self.assertEqual(client.puts, 2)
+
+    def test_failed_write_refetches_body(self):
+        client = FakeClient()
+        session = LiveBlogSession(client)
+        session.start("Live")
+        client.fail_next_put = True
+        with self.assertRaises(RuntimeError):
+            session.add_update("lost")
+
+        session.add_update("kept")
+        self.assertEqual(client.gets, 1)
+        self.assertNotIn("lost", texts(client.body))
+        self.assertIn("kept", texts(client.body))
+
+    def test_failed_batched_write_keeps_updates(self):
+        client = FakeClient()
+        session = LiveBlogSession(client, flush_interval=60)
+        session.start("Live")
+        session.add_update("one")
+        client.fail_next_put = True
+        with self.assertRaises(RuntimeError):
+            session.flush()
+        session.add_update("two")
+        session.flush()
+        self.assertEqual(client.gets, 0)
+        self.assertIn("one", texts(client.body))
+        self.assertIn("two", texts(client.body))
+
+        client.fail_next_put = True
+        with self.assertRaises(RuntimeError):
+            session.end()
+        session.end()
+        closings = [t for t in texts(client.body) if t.startswith("Duration:")]
+        self.assertEqual(len(closings), 1)
+
+    def test_timestamp_matches_strftime(self):
+        session = LiveBlogSession(FakeClient())
+        now = int(time.time())
+        stamp = session._now_str()
+        self.assertIn(stamp, {time.strftime('%I:%M:%S %p', time.localtime(t)) for t in (now, now + 1)})
+        self.assertEqual(len(session._now_str('%I:%M %p')), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
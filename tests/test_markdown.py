@@ -1,6 +1,7 @@
 import unittest
+from unittest import mock
 
-from substack_client import MarkdownToSubstack
+from substack_client import MarkdownToSubstack, SubstackClient, SubstackDraft
 
 
 class TestMarkdownToSubstack(unittest.TestCase):
@@ -8,28 +9,28 @@ class TestMarkdownToSubstack(unittest.TestCase):
         doc = MarkdownToSubstack.convert(
             "Use `code` and **bold** and *ital* and [link](https://example.com)"
         )
-        paragraph = doc["content"][0]
-        self.assertEqual(paragraph["type"], "paragraph")
-        nodes = paragraph["content"]
-
-        def has_mark(text, mark_type, href=None):
-            for node in nodes:
-                if node.get("text") != text:
-                    continue
-                marks = node.get("marks", [])
-                for mark in marks:
-                    if mark.get("type") != mark_type:
-                        continue
-                    if href is None:
-                        return True
-                    if mark.get("attrs", {}).get("href") == href:
-                        return True
-            return False
-
-        self.assertTrue(has_mark("code", "code"))
-        self.assertTrue(has_mark("bold", "strong"))
-        self.assertTrue(has_mark("ital", "em"))
-        self.assertTrue(has_mark("link", "link", href="https://example.com"))
+        self.assertEqual(doc["content"], [{"type": "paragraph", "content": [
+            {"type": "text", "text": "Use "},
+            {"type": "text", "text": "code", "marks": [{"type": "code"}]},
+            {"type": "text", "text": " and "},
+            {"type": "text", "text": "bold", "marks": [{"type": "strong"}]},
+            {"type": "text", "text": " and "},
+            {"type": "text", "text": "ital", "marks": [{"type": "em"}]},
+            {"type": "text", "text": " and "},
+            {"type": "text", "text": "link",
+             "marks": [{"type": "link", "attrs": {"href": "https://example.com", "title": None}}]},
+        ]}])
+
+    def test_unclosed_bold_falls_back_to_italic(self):
+        doc = MarkdownToSubstack.convert("***x* tail")
+        nodes = doc["content"][0]["content"]
+        self.assertEqual(nodes[0], {"type": "text", "text": "*", "marks": [{"type": "em"}]})
+        self.assertEqual(nodes[1], {"type": "text", "text": "x* tail"})
+
+    def test_unmatched_markers_stay_plain_text(self):
+        text = "[a" * 5000
+        doc = MarkdownToSubstack.convert(text)
+        self.assertEqual(doc["content"][0]["content"], [{"type": "text", "text": text}])
 
     def test_fenced_code_language_allows_symbols(self):
         doc = MarkdownToSubstack.convert("```c++\nint x = 0;\n```")
@@ -44,6 +45,38 @@ class TestMarkdownToSubstack(unittest.TestCase):
         self.assertEqual(node["attrs"]["order"], 1)
         self.assertEqual(len(node["content"]), 2)
 
+    def test_cached_results_are_independent_copies(self):
+        with mock.patch.object(MarkdownToSubstack, "_CACHE_ENABLED", True):
+            first = MarkdownToSubstack.convert("# Title\n\nBody")
+            first["content"].append({"type": "horizontalRule"})
+            second = MarkdownToSubstack.convert("# Title\n\nBody")
+        self.assertEqual(len(second["content"]), 2)
+
+    def test_plain_line_fast_path_matches_parser(self):
+        for text in ["", "  \n ", " just landed ", "a!b (c)", "---", "- a", "1. a", "> a", "#a", "a\nb"]:
+            with self.subTest(text=text):
+                self.assertEqual(MarkdownToSubstack.convert(text), MarkdownToSubstack._convert(text))
+
+
+class TestPublishMarkdown(unittest.TestCase):
+    class CaptureClient(SubstackClient):
+        def create_draft(self, title, body, subtitle="", **kwargs):
+            self.created = (title, subtitle, body)
+            return SubstackDraft(id=1)
+
+        def publish_draft(self, draft_id, send_email=False):
+            return {}
+
+    def test_extracts_title_and_subtitle(self):
+        client = self.CaptureClient("token", "pub.example.com")
+        client.publish_markdown("# Title\n**Sub**\n---\nBody\n---\n# Title\n# Other")
+        self.assertEqual(client.created, ("Title", "Sub", "Body\n---\n# Other"))
+
+    def test_defaults_to_untitled(self):
+        client = self.CaptureClient("token", "pub.example.com")
+        client.publish_markdown("Just text\n---")
+        self.assertEqual(client.created, ("Untitled", "", "Just text\n---"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,291 @@
+import asyncio
+import json
+import os
+import sys
+import time
+import unittest
+import warnings
+from unittest import mock
+
+_SERVER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "substack_mcp")
+if _SERVER_DIR not in sys.path:
+    sys.path.insert(0, _SERVER_DIR)
+
+import mcp.types as types
+import server
+from substack_client import SubstackDraft, SubstackPost
+
+
+class FakeClient:
+    """Minimal stand-in for SubstackClient holding drafts in memory"""
+
+    publication = "pub.example.com"
+
+    def __init__(self):
+        self.drafts = {}
+        self.gets = 0
+        self.puts = 0
+        self.fail_update = False
+
+    def get_draft(self, draft_id):
+        self.gets += 1
+        return {"id": draft_id, "body_json": json.loads(json.dumps(self.drafts[draft_id]))}
+
+    def update_draft(self, draft_id, body=None, **kwargs):
+        if self.fail_update:
+            raise RuntimeError("HTTP 500")
+        self.puts += 1
+        if body is not None:
+            self.drafts[draft_id] = json.loads(json.dumps(body))
+        return {}
+
+
+class ServerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = FakeClient()
+        self.client.drafts[1] = {"type": "doc", "content": []}
+        server.client = self.client
+        server._body_cache.clear()
+        self.addCleanup(setattr, server, "client", None)
+        self.addCleanup(setattr, server, "live_session", None)
+        self.addCleanup(server._body_cache.clear)
+        self.addCleanup(server._draft_locks.clear)
+
+    def call(self, name, **arguments):
+        result = asyncio.run(server.call_tool(name, arguments))
+        return json.loads(result[0].text)
+
+
+class TestDraftBodyCache(ServerTestCase):
+    def test_consecutive_appends_fetch_once(self):
+        self.call("substack_append_to_draft", draft_id=1, content="one")
+        result = self.call("substack_append_to_draft", draft_id=1, content="two")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(self.client.gets, 1)
+        self.assertEqual(len(self.client.drafts[1]["content"]), 2)
+
+    def test_failed_write_refetches(self):
+        self.call("substack_append_to_draft", draft_id=1, content="one")
+        self.client.fail_update = True
+        self.assertIn("error", self.call("substack_append_to_draft", draft_id=1, content="lost"))
+        self.client.fail_update = False
+        self.call("substack_append_to_draft", draft_id=1, content="two")
+
+        self.assertEqual(self.client.gets, 2)
+        texts = [n["content"][0]["text"] for n in self.client.drafts[1]["content"]]
+        self.assertEqual(texts, ["one", "two"])
+
+    def test_stale_entry_is_refetched(self):
+        self.call("substack_append_to_draft", draft_id=1, content="one")
+        stamp, body, headings = server._body_cache[1]
+        server._body_cache[1] = (stamp - server._BODY_CACHE_TTL, body, headings)
+        self.call("substack_append_to_draft", draft_id=1, content="two")
+        self.assertEqual(self.client.gets, 2)
+
+    def test_section_count_tracks_cached_and_fetched_bodies(self):
+        self.client.drafts[1]["content"].append(
+            {"type": "heading", "attrs": {"level": 2}, "content": [{"type": "text", "text": "Intro"}]})
+        first = self.call("substack_append_to_draft", draft_id=1, content="x", section_title="A")
+        second = self.call("substack_append_to_draft", draft_id=1, content="## B")
+        self.assertEqual((first["total_sections"], second["total_sections"]), (2, 3))
+
+
+class TestDebouncedAppends(ServerTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(server, "_APPEND_FLUSH_DELAY", 0.01)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(server._pending_ops.clear)
+
+    def texts(self):
+        return [n["content"][0]["text"] for n in self.client.drafts[1]["content"]]
+
+    def test_appends_within_delay_share_one_write(self):
+        async def scenario():
+            results = [
+                await server.call_tool("substack_append_to_draft", {"draft_id": 1, "content": text})
+                for text in ("one", "two")
+            ]
+            queued_puts = self.client.puts
+            await asyncio.sleep(0.05)
+            return results, queued_puts
+
+        results, queued_puts = asyncio.run(scenario())
+        self.assertTrue(all(json.loads(r[0].text)["pending"] for r in results))
+        self.assertEqual(queued_puts, 0)
+        self.assertEqual(self.client.puts, 1)
+        self.assertEqual(self.texts(), ["one", "two"])
+
+    def test_failed_flush_is_retried_before_publish(self):
+        self.client.publish_draft = mock.Mock(return_value={"canonical_url": "u"})
+
+        async def scenario():
+            self.client.fail_update = True
+            await server.call_tool("substack_append_to_draft", {"draft_id": 1, "content": "one"})
+            with mock.patch("sys.stderr"):
+                await asyncio.sleep(0.05)
+            self.client.fail_update = False
+            return await server.call_tool("substack_publish", {"draft_id": 1})
+
+        result = asyncio.run(scenario())
+        self.assertTrue(json.loads(result[0].text)["success"])
+        self.assertEqual(self.texts(), ["one"])
+
+    def test_publish_fails_while_queued_content_cannot_be_written(self):
+        self.client.publish_draft = mock.Mock(return_value={"canonical_url": "u"})
+
+        async def scenario():
+            self.client.fail_update = True
+            await server.call_tool("substack_append_to_draft", {"draft_id": 1, "content": "one"})
+            with mock.patch("sys.stderr"):
+                return await server.call_tool("substack_publish", {"draft_id": 1})
+
+        result = json.loads(asyncio.run(scenario())[0].text)
+        self.assertIn("could not be written", result["error"])
+        self.client.publish_draft.assert_not_called()
+        self.assertEqual(len(server._pending_ops[1]), 1)
+
+    def test_failed_flush_is_retried_automatically(self):
+        async def scenario():
+            self.client.fail_update = True
+            await server.call_tool("substack_append_to_draft", {"draft_id": 1, "content": "one"})
+            with mock.patch("sys.stderr"):
+                await asyncio.sleep(0.03)
+            self.client.fail_update = False
+            await asyncio.sleep(0.05)
+
+        asyncio.run(scenario())
+        self.assertEqual(self.texts(), ["one"])
+        self.assertNotIn(1, server._pending_ops)
+
+
+class TestListings(ServerTestCase):
+    def test_drafts_and_posts_are_projected(self):
+        self.client.get_drafts = lambda: [SubstackDraft(id=1, subtitle="s"), SubstackDraft(id=2, title="T")]
+        self.client.get_archive = lambda limit: [
+            SubstackPost(id=5, title="P", slug="p", canonical_url="u", post_date="d")]
+
+        self.assertEqual(self.call("substack_get_drafts"), {"drafts": [
+            {"id": 1, "title": "(Untitled)", "subtitle": "s"},
+            {"id": 2, "title": "T", "subtitle": ""},
+        ]})
+        self.assertEqual(self.call("substack_get_posts", limit=1), {"posts": [
+            {"id": 5, "title": "P", "url": "u", "date": "d"},
+        ]})
+        resource = asyncio.run(server.read_resource("substack://drafts"))
+        self.assertEqual(json.loads(resource)[0], {"id": 1, "title": "", "subtitle": "s"})
+
+
+class TestDispatch(ServerTestCase):
+    def test_unknown_tool_reports_error(self):
+        self.assertEqual(self.call("substack_nope"), {"error": "Unknown tool: substack_nope"})
+
+
+class TestNodeShapes(ServerTestCase):
+    def test_code_block_nodes(self):
+        self.call("substack_add_code_block", draft_id=1, code="x = 1", language="python",
+                  filename="a.py", caption="Setup")
+        self.assertEqual(self.client.drafts[1]["content"], [
+            {"type": "paragraph",
+             "content": [{"type": "text", "text": "📄 a.py", "marks": [{"type": "code"}]}]},
+            {"type": "codeBlock", "attrs": {"language": "python"},
+             "content": [{"type": "text", "text": "x = 1"}]},
+            {"type": "paragraph",
+             "content": [{"type": "text", "text": "Setup", "marks": [{"type": "em"}]}]},
+        ])
+
+
+class TestLiveSession(ServerTestCase):
+    def read(self):
+        return json.loads(asyncio.run(server.read_resource("substack://live-session")))
+
+    def test_resource_tracks_updates(self):
+        self.assertEqual(self.read(), {"active": False})
+        server.live_session = server.LiveSession(1, "Live", "2024-01-01T00:00:00")
+        self.assertEqual(self.read()["updates"], 0)
+        cached = server.live_session.to_json()
+        self.assertIs(server.live_session.to_json(), cached)
+
+        self.call("substack_append_to_draft", draft_id=1, content="x")
+        self.assertEqual(self.read()["updates"], 1)
+
+
+class TestConcurrentAppends(ServerTestCase):
+    def test_queued_appends_share_one_write(self):
+        async def scenario():
+            lock = server._draft_locks[1]
+            await lock.acquire()
+            calls = [
+                asyncio.ensure_future(server.call_tool(
+                    "substack_append_to_draft", {"draft_id": 1, "content": text}))
+                for text in ("one", "two", "three")
+            ]
+            await asyncio.sleep(0)
+            lock.release()
+            return await asyncio.gather(*calls)
+
+        results = asyncio.run(scenario())
+        self.assertTrue(all(json.loads(r[0].text)["success"] for r in results))
+        self.assertEqual(self.client.puts, 1)
+        texts = [n["content"][0]["text"] for n in self.client.drafts[1]["content"]]
+        self.assertEqual(texts, ["one", "two", "three"])
+
+
+class TestListTools(unittest.TestCase):
+    def test_tools_are_built_once(self):
+        first = asyncio.run(server.list_tools())
+        second = asyncio.run(server.list_tools())
+        self.assertIs(first, second)
+        names = [tool.name for tool in first]
+        self.assertIn("substack_create_draft", names)
+        self.assertEqual(len(names), len(set(names)))
+
+    def test_every_tool_has_a_handler(self):
+        names = {tool.name for tool in asyncio.run(server.list_tools())}
+        self.assertEqual(names, set(server._HANDLERS))
+
+    def test_listings_serialize_cleanly(self):
+        tools = types.ListToolsResult(tools=asyncio.run(server.list_tools()))
+        resources = types.ListResourcesResult(resources=asyncio.run(server.list_resources()))
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            payload = json.loads(tools.model_dump_json(by_alias=True, exclude_none=True))
+            uris = json.loads(resources.model_dump_json(by_alias=True, exclude_none=True))
+        self.assertEqual(payload["tools"][0]["inputSchema"]["type"], "object")
+        self.assertIn("substack://live-session", [r["uri"] for r in uris["resources"]])
+
+
+class TestJsonHelpers(unittest.TestCase):
+    def test_dumps_round_trips(self):
+        result = {"success": True, "title": "Caf\u00e9", "ids": [1, 2]}
+        self.assertEqual(json.loads(server._dumps(result)), result)
+        self.assertEqual(server._dumps(result), '{"success":true,"title":"Caf\u00e9","ids":[1,2]}')
+        self.assertEqual(server._loads('{"a": [1]}'), {"a": [1]})
+
+
+class TestVerifyClient(ServerTestCase):
+    def test_failed_check_drops_client(self):
+        self.client.test_connection = lambda: False
+        with mock.patch("sys.stderr"):
+            asyncio.run(server._verify_client())
+        self.assertIsNone(server.client)
+
+    def test_successful_check_keeps_client(self):
+        self.client.test_connection = lambda: True
+        with mock.patch("sys.stderr"):
+            asyncio.run(server._verify_client())
+        self.assertIs(server.client, self.client)
+
+
+class TestShortTime(unittest.TestCase):
+    def test_matches_strftime(self):
+        for hour in (0, 9, 12, 23):
+            lt = time.struct_time((2024, 1, 1, hour, 5, 0, 0, 1, 0))
+            with mock.patch.object(server.time, "localtime", return_value=lt):
+                self.assertEqual(server._short_time_now(), time.strftime("%I:%M %p", lt))
+
+
+if __name__ == "__main__":
+    unittest.main()